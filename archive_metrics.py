@@ -0,0 +1,184 @@
+import bisect
+import json
+import os
+import threading
+from urllib.parse import urlsplit, parse_qsl
+
+
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000, 60000)
+
+
+def url_template(url, params=None):
+
+    parts = urlsplit(url)
+    segments = parts.path.split('/')
+
+    if parts.path.endswith('/v3/auth/tokens'):
+        template = '/v3/auth/tokens'
+    elif len(segments) > 2 and segments[1] == 'v1' and segments[2].startswith('AUTH_'):
+        template = '/v1/{account}'
+        if len(segments) > 3 and segments[3]:
+            template += '/{segment_container}' if segments[3].endswith('_segments') else '/{container}'
+        if len(segments) > 4 and any(segments[4:]):
+            template += '/{object}'
+    else:
+        template = parts.path or '/'
+
+    query_names = [name for name, value in parse_qsl(parts.query, keep_blank_values=True)]
+    query_names.extend(params or {})
+    if query_names:
+        template += '?' + '&'.join(sorted(set(query_names)))
+
+    return template
+
+
+class LatencyHistogram:
+
+    def __init__(self, buckets_ms=LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+
+        milliseconds = seconds * 1000
+        self.counts[bisect.bisect_left(self.buckets_ms, milliseconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, percent):
+
+        if not self.count:
+            return None
+
+        threshold = self.count * percent / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= threshold:
+                if index < len(self.buckets_ms):
+                    return min(self.buckets_ms[index] / 1000, self.max)
+                return self.max
+        return self.max
+
+    def summary(self):
+
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.max if self.count else None
+        }
+
+
+class HistogramSink:
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+
+        key = (record['host'], record['method'], record['url_template'])
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = {
+                    'count': 0,
+                    'errors': 0,
+                    'retries': 0,
+                    'statuses': {},
+                    'bytes_sent': 0,
+                    'bytes_received': 0,
+                    'latency': LatencyHistogram(),
+                    'ttfb': LatencyHistogram()
+                }
+                self._stats[key] = stats
+
+            stats['count'] += 1
+            stats['retries'] += record['retries']
+            stats['bytes_sent'] += record['bytes_sent'] or 0
+            stats['bytes_received'] += record['bytes_received'] or 0
+            if record['status'] is None:
+                stats['errors'] += 1
+            else:
+                stats['statuses'][record['status']] = stats['statuses'].get(record['status'], 0) + 1
+            stats['latency'].add(record['latency'])
+            if record['ttfb'] is not None:
+                stats['ttfb'].add(record['ttfb'])
+
+    def summary(self):
+
+        with self._lock:
+            return [
+                {
+                    'host': host,
+                    'method': method,
+                    'url_template': template,
+                    'count': stats['count'],
+                    'errors': stats['errors'],
+                    'retries': stats['retries'],
+                    'statuses': dict(stats['statuses']),
+                    'bytes_sent': stats['bytes_sent'],
+                    'bytes_received': stats['bytes_received'],
+                    'latency': stats['latency'].summary(),
+                    'ttfb': stats['ttfb'].summary()
+                }
+                for (host, method, template), stats in sorted(self._stats.items())
+            ]
+
+    def report_text(self):
+
+        def ms(value):
+            return f"{value * 1000:.0f}ms" if value is not None else '-'
+
+        lines = []
+        for item in self.summary():
+            latency = item['latency']
+            ttfb = item['ttfb']
+            lines.append(
+                f"{item['method']} {item['host']}{item['url_template']}: {item['count']}회, "
+                f"오류 {item['errors']}, 재시도 {item['retries']}, "
+                f"지연 p50 {ms(latency['p50'])} p90 {ms(latency['p90'])} p99 {ms(latency['p99'])} 최대 {ms(latency['max'])}, "
+                f"첫 바이트 p50 {ms(ttfb['p50'])} p90 {ms(ttfb['p90'])}"
+            )
+        return '\n'.join(lines) if lines else "기록된 요청이 없습니다"
+
+    def reset(self):
+
+        with self._lock:
+            self._stats = {}
+
+
+class JsonlSink:
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __call__(self, record):
+
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+
+class CallbackSink:
+
+    def __init__(self, callback, min_latency=0.0):
+        self.callback = callback
+        self.min_latency = min_latency
+
+    def __call__(self, record):
+
+        if record['latency'] >= self.min_latency:
+            self.callback(record)
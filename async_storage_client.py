@@ -0,0 +1,382 @@
+import asyncio
+import json
+import os
+import ssl
+import threading
+
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from transfer_utils import TransferStatusError
+
+
+class ArchiveResponse:
+
+    def __init__(self, status_code, headers, content=b''):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class AsyncArchiveStorageClient:
+
+    def __init__(self, client, max_concurrency=64):
+        if aiohttp is None:
+            raise ImportError("aiohttp 패키지가 필요합니다: pip install aiohttp")
+
+        self.client = client
+        self.token_manager = client.token_manager
+        self.retry_policy = client.retry_policy
+        self.max_concurrency = max_concurrency
+        self.download_chunk_size = 1024 * 1024
+        self.verbose = False
+        self._session = None
+        self._semaphore = None
+
+    @property
+    def base_url(self):
+        return f"{self.client.storage_url}/v1/AUTH_{self.client.project_id}"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def _get_session(self):
+
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                ssl=ssl.create_default_context(cafile=DEFAULT_CA_BUNDLE_PATH)
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=300)
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self):
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _get_token(self, stale_token=None):
+
+        if stale_token is None:
+            token = self.token_manager.current_token()
+            if token:
+                return token
+            token = await asyncio.to_thread(self.token_manager.get_token)
+        else:
+            token = await asyncio.to_thread(self.token_manager.refresh, stale_token)
+
+        if not token:
+            raise Exception("인증 토큰을 얻을 수 없습니다")
+        return token
+
+    def _is_retryable_error(self, error):
+
+        if getattr(error, 'status_code', None) in self.retry_policy.retry_statuses:
+            return True
+        return isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError))
+
+    async def _request(self, method, url, params=None, data=None, headers=None, handle_response=None):
+
+        session = self._get_session()
+
+        async def send():
+            async with self._semaphore:
+                token = await self._get_token()
+                for attempt in range(2):
+                    request_headers = dict(headers or {})
+                    request_headers['X-Auth-Token'] = token
+                    body = data() if callable(data) else data
+
+                    try:
+                        async with session.request(method, url, params=params, data=body,
+                                                   headers=request_headers) as response:
+                            if response.status == 401 and attempt == 0:
+                                print("인증 토큰 만료: 토큰 재발급 후 요청 재시도")
+                                token = await self._get_token(token)
+                                continue
+
+                            if handle_response is not None and response.status in (200, 206):
+                                content = await handle_response(response)
+                            else:
+                                content = await response.read()
+                            return ArchiveResponse(response.status, response.headers, content)
+                    finally:
+                        if hasattr(body, 'close'):
+                            body.close()
+
+        return await self.retry_policy.call_async(send, f"{method} 요청", self._is_retryable_error)
+
+    async def head_object(self, container_name, object_name):
+
+        try:
+            response = await self._request('HEAD', f"{self.base_url}/{container_name}/{object_name}")
+            if response.status_code in [200, 204]:
+                return dict(response.headers)
+            if response.status_code != 404:
+                print(f"오브젝트 조회 실패 ({object_name}): {response.status_code}")
+            return None
+
+        except Exception as e:
+            print(f"오브젝트 조회 오류 ({object_name}): {str(e)}")
+            return None
+
+    async def upload_file(self, container_name, object_name, file_path, progress_callback=None):
+
+        try:
+            if not os.path.exists(file_path):
+                print(f"파일이 존재하지 않음: {file_path}")
+                return False
+
+            file_size = os.path.getsize(file_path)
+            if file_size > self.client.slo_threshold:
+                return await asyncio.to_thread(self.client.upload_file, container_name, object_name, file_path,
+                                               progress_callback)
+
+            response = await self._request(
+                'PUT',
+                f"{self.base_url}/{container_name}/{object_name}",
+                data=lambda: open(file_path, 'rb'),
+                headers={'Content-Type': 'application/octet-stream', 'Content-Length': str(file_size)}
+            )
+
+            if response.status_code in [200, 201]:
+                if self.verbose:
+                    print(f"파일 업로드 성공: {object_name}")
+                if progress_callback:
+                    progress_callback(100)
+                return True
+
+            print(f"업로드 실패 ({object_name}): 상태 코드 {response.status_code}")
+            return False
+
+        except Exception as e:
+            print(f"파일 업로드 오류 ({object_name}): {str(e)}")
+            return False
+
+    async def download_file(self, container_name, object_name, save_path, progress_callback=None):
+
+        part_path = f"{save_path}.part"
+        delegate = [False]
+
+        async def write_body(response):
+            total_size = response.content_length
+            if total_size is not None and total_size >= self.client.parallel_download_threshold:
+                delegate[0] = True
+                return b''
+
+            written = 0
+            with open(part_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(self.download_chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+                    if progress_callback and total_size:
+                        progress_callback(int(written / total_size * 100))
+
+            if total_size is not None and written != total_size:
+                raise aiohttp.ClientPayloadError(f"다운로드 크기 불일치: {written}/{total_size} bytes")
+            return b''
+
+        try:
+            save_dir = os.path.dirname(save_path)
+            if save_dir:
+                os.makedirs(save_dir, exist_ok=True)
+
+            response = await self._request('GET', f"{self.base_url}/{container_name}/{object_name}",
+                                           handle_response=write_body)
+
+            if delegate[0]:
+                return await asyncio.to_thread(self.client.download_file, container_name, object_name, save_path,
+                                               progress_callback)
+
+            if response.status_code != 200:
+                print(f"파일 다운로드 실패 ({object_name}): {response.status_code}")
+                return False
+
+            os.replace(part_path, save_path)
+            if self.verbose:
+                print(f"파일 다운로드 성공: {object_name}")
+            return True
+
+        except Exception as e:
+            print(f"파일 다운로드 오류 ({object_name}): {str(e)}")
+            return False
+
+    async def delete_object(self, container_name, object_name):
+
+        try:
+            response = await self._request('DELETE', f"{self.base_url}/{container_name}/{object_name}")
+
+            if response.status_code == 204:
+                if self.verbose:
+                    print(f"오브젝트 삭제 성공: {object_name}")
+                return True
+
+            print(f"오브젝트 삭제 실패 ({object_name}): {response.status_code}")
+            return False
+
+        except Exception as e:
+            print(f"오브젝트 삭제 오류 ({object_name}): {str(e)}")
+            return False
+
+    async def get_objects_with_prefix(self, container_name, prefix="", delimiter="/", page_size=10000):
+
+        objects = []
+        marker = None
+
+        try:
+            while True:
+                params = {'format': 'json', 'limit': page_size}
+                if delimiter:
+                    params['delimiter'] = delimiter
+                if prefix:
+                    params['prefix'] = prefix
+                if marker:
+                    params['marker'] = marker
+
+                response = await self._request('GET', f"{self.base_url}/{container_name}", params=params)
+
+                if response.status_code == 204:
+                    break
+                if response.status_code != 200:
+                    raise TransferStatusError(f"오브젝트 목록 조회 실패: {response.status_code} - {response.text}",
+                                              response.status_code)
+
+                page = response.json()
+                objects.extend(page)
+                if len(page) < page_size:
+                    break
+
+                marker = page[-1].get('name') or page[-1].get('subdir')
+
+            return objects
+
+        except Exception as e:
+            print(f"오브젝트 목록 조회 오류: {str(e)}")
+            return []
+
+    async def get_containers(self):
+
+        try:
+            response = await self._request('GET', self.base_url, params={'format': 'json'})
+
+            if response.status_code == 200:
+                return response.json()
+            if response.status_code == 204:
+                return []
+
+            print(f"컨테이너 목록 조회 실패: {response.status_code}")
+            return []
+
+        except Exception as e:
+            print(f"컨테이너 목록 조회 오류: {str(e)}")
+            return []
+
+    async def run_batch(self, operation, args_list, progress_callback=None):
+
+        args_list = list(args_list)
+        results = [None] * len(args_list)
+        pending = set()
+        completed = 0
+
+        async def run(index, args):
+            try:
+                results[index] = await operation(*args)
+            except Exception as e:
+                print(f"일괄 작업 오류: {str(e)}")
+
+        for index, args in enumerate(args_list):
+            pending.add(asyncio.ensure_future(run(index, args)))
+            if len(pending) >= self.max_concurrency * 2:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                completed += len(done)
+                if progress_callback:
+                    progress_callback(int(completed / len(args_list) * 100))
+
+        if pending:
+            await asyncio.wait(pending)
+        if progress_callback and args_list:
+            progress_callback(100)
+
+        return results
+
+
+class BlockingArchiveStorageClient:
+
+    def __init__(self, client, max_concurrency=64):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self.async_client = AsyncArchiveStorageClient(client, max_concurrency)
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def upload_file(self, container_name, object_name, file_path, progress_callback=None):
+        return self._run(self.async_client.upload_file(container_name, object_name, file_path, progress_callback))
+
+    def download_file(self, container_name, object_name, save_path, progress_callback=None):
+        return self._run(self.async_client.download_file(container_name, object_name, save_path, progress_callback))
+
+    def delete_object(self, container_name, object_name):
+        return self._run(self.async_client.delete_object(container_name, object_name))
+
+    def head_object(self, container_name, object_name):
+        return self._run(self.async_client.head_object(container_name, object_name))
+
+    def get_objects_with_prefix(self, container_name, prefix="", delimiter="/"):
+        return self._run(self.async_client.get_objects_with_prefix(container_name, prefix, delimiter))
+
+    def get_containers(self):
+        return self._run(self.async_client.get_containers())
+
+    def upload_files(self, container_name, items, progress_callback=None):
+        return self._run(self.async_client.run_batch(
+            self.async_client.upload_file,
+            [(container_name, object_name, file_path) for object_name, file_path in items],
+            progress_callback
+        ))
+
+    def download_files(self, container_name, items, progress_callback=None):
+        return self._run(self.async_client.run_batch(
+            self.async_client.download_file,
+            [(container_name, object_name, save_path) for object_name, save_path in items],
+            progress_callback
+        ))
+
+    def head_objects(self, container_name, object_names, progress_callback=None):
+        return self._run(self.async_client.run_batch(
+            self.async_client.head_object, [(container_name, name) for name in object_names], progress_callback
+        ))
+
+    def delete_objects(self, container_name, object_names, progress_callback=None):
+        return self._run(self.async_client.run_batch(
+            self.async_client.delete_object, [(container_name, name) for name in object_names], progress_callback
+        ))
+
+    def close(self):
+
+        if not self._loop.is_running():
+            return
+        self._run(self.async_client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from http_transport import TRANSPORTS
+from storage_client import NaverArchiveStorageClient
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    wbufsize = 64 * 1024
+    payload = b''
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b'', headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        expires_at = time.strftime('%Y-%m-%dT%H:%M:%S.000000Z', time.gmtime(time.time() + 3600))
+        body = json.dumps({'token': {'expires_at': expires_at}}).encode('utf-8')
+        self._send(201, body, {'X-Subject-Token': 'bench-token', 'Content-Type': 'application/json'})
+
+    def do_PUT(self):
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        self._send(201, headers={'Etag': '"d41d8cd98f00b204e9800998ecf8427e"'})
+
+    def do_GET(self):
+        self._send(200, self.payload, {'Content-Type': 'application/octet-stream'})
+
+    def do_HEAD(self):
+        self._send(200, self.payload, {'Content-Type': 'application/octet-stream'})
+
+
+def start_server(object_size):
+    StandInHandler.payload = b'x' * object_size
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_benchmark(transport, base_url, method, count, threads, object_size):
+    client = NaverArchiveStorageClient(transport=transport)
+    client.auth_url = base_url
+    client.storage_url = base_url
+    client.set_credentials('bench', 'bench', 'bench', 'bench')
+    client.get_token()
+
+    body = b'x' * object_size
+
+    def one_request(index):
+        url = f"{base_url}/v1/AUTH_bench/bench/object-{index % 100}"
+        response = client._make_request(method, url, data=body if method == 'PUT' else None, timeout=30)
+        response.content
+        if response.status_code >= 300:
+            raise RuntimeError(f"{method} failed with status {response.status_code}")
+
+    for index in range(min(count, threads * 4)):
+        one_request(index)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(one_request, range(count)))
+    elapsed = time.perf_counter() - start
+
+    client.transport.close()
+    return count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Archive client transport microbenchmark')
+    parser.add_argument('--requests', type=int, default=2000, help='requests per method and transport')
+    parser.add_argument('--threads', type=int, default=1, help='concurrent client threads')
+    parser.add_argument('--size', type=int, default=1024, help='object size in bytes for PUT/GET')
+    parser.add_argument('--transports', nargs='+', default=list(TRANSPORTS), choices=list(TRANSPORTS))
+    args = parser.parse_args()
+
+    server = start_server(args.size)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"Stand-in server: {base_url}, {args.requests} requests, {args.threads} thread(s), {args.size} byte objects")
+    print("=" * 50)
+    print(f"{'transport':<12}{'PUT/s':>12}{'GET/s':>12}{'HEAD/s':>12}")
+
+    for transport in args.transports:
+        rates = [run_benchmark(transport, base_url, method, args.requests, args.threads, args.size)
+                 for method in ('PUT', 'GET', 'HEAD')]
+        print(f"{transport:<12}" + ''.join(f"{rate:>12.0f}" for rate in rates))
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
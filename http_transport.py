@@ -0,0 +1,311 @@
+import json
+import threading
+import time
+from datetime import timedelta
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, requote_uri, super_len
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+
+class ConnectionPoolStats:
+
+    def __init__(self):
+        self.pool_maxsize = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+        self._lock = threading.Lock()
+
+    def checkout(self, wait_time):
+
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            if wait_time is not None:
+                self.waits += 1
+                self.wait_time += wait_time
+
+    def checkin(self):
+
+        with self._lock:
+            self.in_use -= 1
+
+    def count(self, key):
+
+        with self._lock:
+            setattr(self, key, getattr(self, key) + 1)
+
+    def snapshot(self):
+
+        with self._lock:
+            return {
+                'pool_maxsize': self.pool_maxsize,
+                'in_use': self.in_use,
+                'peak_in_use': self.peak_in_use,
+                'checkouts': self.checkouts,
+                'waits': self.waits,
+                'wait_time': self.wait_time,
+                'new_connections': self.new_connections,
+                'tls_handshakes': self.tls_handshakes
+            }
+
+    def report_text(self):
+
+        stats = self.snapshot()
+        return (f"연결 풀: 최대 {stats['pool_maxsize']}, 사용 중 {stats['in_use']} (최대 {stats['peak_in_use']}), "
+                f"대여 {stats['checkouts']}회, 대기 {stats['waits']}회 ({stats['wait_time']:.1f}초), "
+                f"새 연결 {stats['new_connections']}회, TLS 핸드셰이크 {stats['tls_handshakes']}회")
+
+
+def instrumented_pool_classes(stats, wait_timeout=60):
+
+    class InstrumentedHTTPConnection(HTTPConnection):
+
+        def connect(self):
+            super().connect()
+            stats.count('new_connections')
+
+    class InstrumentedHTTPSConnection(HTTPSConnection):
+
+        def connect(self):
+            super().connect()
+            stats.count('new_connections')
+            stats.count('tls_handshakes')
+
+    class InstrumentedPoolMixin:
+
+        def _get_conn(self, timeout=None):
+
+            waiting = self.block and self.pool is not None and self.pool.empty()
+            started = time.monotonic()
+            conn = super()._get_conn(timeout=wait_timeout if timeout is None else timeout)
+            stats.checkout(time.monotonic() - started if waiting else None)
+            return conn
+
+        def _put_conn(self, conn):
+
+            stats.checkin()
+            super()._put_conn(conn)
+
+    class InstrumentedHTTPConnectionPool(InstrumentedPoolMixin, HTTPConnectionPool):
+        ConnectionCls = InstrumentedHTTPConnection
+
+    class InstrumentedHTTPSConnectionPool(InstrumentedPoolMixin, HTTPSConnectionPool):
+        ConnectionCls = InstrumentedHTTPSConnection
+
+    return {'http': InstrumentedHTTPConnectionPool, 'https': InstrumentedHTTPSConnectionPool}
+
+
+class RequestsTransport:
+
+    name = 'requests'
+
+    def __init__(self, pool_maxsize=20, pool_wait_timeout=60):
+        self.pool_stats = ConnectionPoolStats()
+        self.pool_wait_timeout = pool_wait_timeout
+        self.adapter = HTTPAdapter(max_retries=Retry(total=0, read=False, redirect=5, raise_on_status=False))
+        self.resize(pool_maxsize)
+        self._thread_local = threading.local()
+
+    def resize(self, pool_maxsize):
+
+        old_pool_manager = self.adapter.poolmanager
+        self.adapter.init_poolmanager(pool_maxsize, pool_maxsize, block=True)
+        self.adapter.poolmanager.pool_classes_by_scheme = instrumented_pool_classes(self.pool_stats, self.pool_wait_timeout)
+        self.pool_stats.pool_maxsize = pool_maxsize
+
+        # 새 요청은 이미 새 풀을 사용하므로 이전 풀의 유휴 연결을 닫음
+        old_pool_manager.clear()
+
+    @property
+    def session(self):
+
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.verify = True
+            session.mount("http://", self.adapter)
+            session.mount("https://", self.adapter)
+            self._thread_local.session = session
+        return session
+
+    def request(self, method, url, params=None, data=None, headers=None, stream=False, timeout=None):
+
+        try:
+            return self.session.request(method, url, params=params, data=data, headers=headers, stream=stream,
+                                        timeout=timeout)
+        except urllib3.exceptions.EmptyPoolError as e:
+            raise requests.exceptions.ConnectionError(str(e))
+
+    def close(self):
+        self.adapter.close()
+
+
+class Urllib3Response:
+
+    def __init__(self, response, url, elapsed):
+        self.raw = response
+        self.url = url
+        self.elapsed = elapsed
+        self.status_code = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        self._content = None
+        self._consumed = False
+
+    @property
+    def content(self):
+
+        if self._content is None:
+            try:
+                self._content = self.raw.data
+            except urllib3.exceptions.HTTPError as e:
+                raise translate_error(e, streaming=True)
+        return self._content
+
+    @property
+    def text(self):
+
+        encoding = 'utf-8'
+        content_type = self.headers.get('content-type', '')
+        if 'charset=' in content_type:
+            encoding = content_type.split('charset=', 1)[1].split(';')[0].strip().strip('"') or encoding
+
+        try:
+            return self.content.decode(encoding, errors='replace')
+        except LookupError:
+            return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=1):
+
+        if self._content is not None:
+            for i in range(0, len(self._content), chunk_size):
+                yield self._content[i:i + chunk_size]
+            return
+
+        try:
+            for chunk in self.raw.stream(chunk_size, decode_content=True):
+                yield chunk
+        except urllib3.exceptions.HTTPError as e:
+            raise translate_error(e, streaming=True)
+        self._consumed = True
+
+    def close(self):
+
+        if self._content is None and not self._consumed:
+            self.raw.close()
+        self.raw.release_conn()
+
+
+class Urllib3Transport:
+
+    name = 'urllib3'
+
+    def __init__(self, pool_maxsize=20, pool_wait_timeout=60):
+        self.pool_stats = ConnectionPoolStats()
+        self.pool_wait_timeout = pool_wait_timeout
+        self.resize(pool_maxsize)
+
+    def resize(self, pool_maxsize):
+
+        old_pool_manager = getattr(self, 'pool_manager', None)
+        self.pool_manager = urllib3.PoolManager(
+            num_pools=10,
+            maxsize=pool_maxsize,
+            block=True,
+            cert_reqs='CERT_REQUIRED',
+            ca_certs=DEFAULT_CA_BUNDLE_PATH,
+            retries=Retry(total=None, connect=0, read=False, status=0, other=0, redirect=5,
+                          raise_on_redirect=False, raise_on_status=False)
+        )
+        self.pool_manager.pool_classes_by_scheme = instrumented_pool_classes(self.pool_stats, self.pool_wait_timeout)
+        self.pool_stats.pool_maxsize = pool_maxsize
+
+        if old_pool_manager is not None:
+            old_pool_manager.clear()
+
+    def request(self, method, url, params=None, data=None, headers=None, stream=False, timeout=None):
+
+        url = requote_uri(url)
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+
+        headers = dict(headers or {})
+        if data is not None and not isinstance(data, (bytes, str)) and 'Content-Length' not in headers:
+            length = super_len(data) if hasattr(data, 'read') else None
+            if length:
+                headers['Content-Length'] = str(length)
+
+        if isinstance(timeout, tuple):
+            timeout = urllib3.Timeout(connect=timeout[0], read=timeout[1])
+        elif timeout is not None:
+            timeout = urllib3.Timeout(connect=timeout, read=timeout)
+
+        started = time.perf_counter()
+        try:
+            response = self.pool_manager.request(
+                method, url, body=data, headers=headers, timeout=timeout, preload_content=False
+            )
+        except urllib3.exceptions.HTTPError as e:
+            raise translate_error(e)
+
+        response = Urllib3Response(response, url, timedelta(seconds=time.perf_counter() - started))
+        if not stream:
+            response.content
+        return response
+
+    def close(self):
+        self.pool_manager.clear()
+
+
+def translate_error(error, streaming=False):
+
+    if isinstance(error, urllib3.exceptions.MaxRetryError) and error.reason is not None:
+        error = error.reason
+
+    if isinstance(error, urllib3.exceptions.ConnectTimeoutError):
+        return requests.exceptions.ConnectTimeout(str(error))
+    if isinstance(error, urllib3.exceptions.ReadTimeoutError):
+        if streaming:
+            return requests.exceptions.ConnectionError(str(error))
+        return requests.exceptions.ReadTimeout(str(error))
+    if isinstance(error, urllib3.exceptions.SSLError):
+        return requests.exceptions.SSLError(str(error))
+    if isinstance(error, urllib3.exceptions.DecodeError):
+        return requests.exceptions.ContentDecodingError(str(error))
+    if isinstance(error, urllib3.exceptions.ProtocolError) and streaming:
+        return requests.exceptions.ChunkedEncodingError(str(error))
+    if isinstance(error, urllib3.exceptions.LocationParseError):
+        return requests.exceptions.InvalidURL(str(error))
+    return requests.exceptions.ConnectionError(str(error))
+
+
+TRANSPORTS = {
+    RequestsTransport.name: RequestsTransport,
+    Urllib3Transport.name: Urllib3Transport
+}
+
+
+def create_transport(transport=None, **kwargs):
+
+    if transport is None:
+        transport = RequestsTransport.name
+    if isinstance(transport, str):
+        if transport not in TRANSPORTS:
+            raise ValueError(f"지원하지 않는 전송 방식입니다: {transport}")
+        return TRANSPORTS[transport](**kwargs)
+    return transport
@@ -13,6 +13,8 @@ from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer
 from PyQt6.QtGui import QPalette
 
 from storage_client import NaverArchiveStorageClient
+from archive_metrics import HistogramSink, CallbackSink
+from s3_utils import load_transfer_profile
 from object_storage_client import ObjectStorageClient
 from ncloud_storage_client import RealNcloudStorageClient
 
@@ -442,6 +444,7 @@ class StorageConnectionDialog(QDialog):
                     self.domain_id_edit.text(),
                     self.project_id_edit.text()
                 )
+                client.set_token_cache(os.path.join(os.path.expanduser('~'), '.ncp_storage_manager', 'archive_token.json'))
 
                 if client.test_connection():
                     self.result_data = {
@@ -463,11 +466,13 @@ class StorageConnectionDialog(QDialog):
 
                 if self.storage_type == 'object':
                     client = ObjectStorageClient()
+                    client.transfer_profile = load_transfer_profile(storage_type='object')
                     success = client.set_credentials(self.access_key_edit.text(), self.secret_key_edit.text())
                     if success:
                         success = client.test_connection()
                 else:
                     client = RealNcloudStorageClient()
+                    client.transfer_profile = load_transfer_profile(storage_type='ncloud')
                     success = client.connect(self.access_key_edit.text(), self.secret_key_edit.text())
 
                 if success:
@@ -800,15 +805,48 @@ class MultiFileUploadThread(QThread):
             self.finished.emit(False, error_msg)
 
 
+class ListObjectsThread(QThread):
+
+    page_loaded = pyqtSignal(str, int, list)
+    failed = pyqtSignal(str, int, str)
+
+    def __init__(self, client, storage_type, generation, container_or_bucket, path):
+        super().__init__()
+        self.client = client
+        self.storage_type = storage_type
+        self.generation = generation
+        self.container_or_bucket = container_or_bucket
+        self.path = path
+        self.cancelled = False
+
+    def run(self):
+        try:
+            pages = self.client.iter_objects(self.container_or_bucket, prefix=self.path, delimiter='/')
+
+            for page in pages:
+                # 다른 폴더로 이동했거나 새로고침된 경우 남은 페이지는 가져오지 않음
+                if self.cancelled:
+                    break
+                self.page_loaded.emit(self.storage_type, self.generation, page)
+
+        except Exception as e:
+            self.failed.emit(self.storage_type, self.generation, str(e))
+
 class IntegratedStorageGUI(QMainWindow):
+
+    archive_request_recorded = pyqtSignal(dict)
+
     def __init__(self):
         super().__init__()
 
         self.archive_client = None
+        self.archive_request_stats = HistogramSink()
         self.object_client = None
         self.ncloud_client = None
 
         self.current_storage_type = None
+        self.list_generations = {'archive': 0, 'object': 0, 'ncloud': 0}
+        self.list_threads = []
 
         self.storage_states = {
             'archive': {
@@ -832,6 +870,8 @@ class IntegratedStorageGUI(QMainWindow):
         self.apply_styles()
         self.setup_message_box_styles()
 
+        self.archive_request_recorded.connect(self.on_archive_request_recorded)
+
         self.theme_timer = QTimer()
         self.theme_timer.timeout.connect(self.check_theme_change)
         self.theme_timer.start(1000)
@@ -923,6 +963,8 @@ class IntegratedStorageGUI(QMainWindow):
 
         if self.current_storage_type == 'archive':
             self.archive_client = client_data['client']
+            self.archive_client.add_request_observer(self.archive_request_stats)
+            self.archive_client.add_request_observer(CallbackSink(self.archive_request_recorded.emit))
             self.storage_states['archive']['connected'] = True
             self.refresh_containers()
         elif self.current_storage_type == 'object':
@@ -1358,57 +1400,81 @@ class IntegratedStorageGUI(QMainWindow):
             return
 
         try:
+            storage_type = self.current_storage_type
+            path = self.storage_states[storage_type]['current_path']
 
-            if self.current_storage_type == 'archive':
+            if storage_type == 'archive':
                 files_list = self.archive_files_list
-                path = self.storage_states['archive']['current_path']
-
-                objects = client.get_objects_with_prefix(container_or_bucket, path)
-                items = client.parse_folder_structure(objects, path)
+            elif storage_type == 'object':
+                files_list = self.object_files_list
             else:
-                if self.current_storage_type == 'object':
-                    files_list = self.object_files_list
-                else:
-                    files_list = self.ncloud_files_list
-
-                path = self.storage_states[self.current_storage_type]['current_path']
+                files_list = self.ncloud_files_list
 
-                items = client.list_objects(container_or_bucket, prefix=path, delimiter='/')
+            # 이전 목록 조회는 중단하고, 늦게 도착한 페이지는 세대 번호로 걸러냄
+            self.list_generations[storage_type] += 1
+            for thread in self.list_threads:
+                if thread.storage_type == storage_type:
+                    thread.cancelled = True
 
             files_list.clear()
 
-            for item in items:
-                list_item = QListWidgetItem()
+            thread = ListObjectsThread(client, storage_type, self.list_generations[storage_type],
+                                       container_or_bucket, path)
+            thread.page_loaded.connect(self.on_files_page_loaded)
+            thread.failed.connect(self.on_files_list_failed)
+            thread.finished.connect(lambda: self.list_threads.remove(thread))
+            self.list_threads.append(thread)
+            thread.start()
 
-                icon = "📁" if item['type'] == 'folder' else "📄"
-                display_text = f"{icon} {item['name']}"
+            self.update_path_display()
 
-                if item['type'] == 'file' and item.get('size', 0) > 0:
-                    size_text = CompressedUploadThread.format_file_size(item['size'])
-                    display_text += f" ({size_text})"
-                    
-                    # NCloud Storage에서만 Storage Class 정보 표시
-                    if self.current_storage_type == 'ncloud' and 'storage_class' in item:
-                        storage_class = item['storage_class']
-                        if storage_class == 'STANDARD':
-                            display_text += " [일반]"
-                        elif storage_class == 'DEEP_ARCHIVE':
-                            display_text += " [아카이브]"
-                        else:
-                            display_text += f" [{storage_class}]"
+        except Exception as e:
+            print(f"파일 목록 새로고침 오류: {str(e)}")
+
+    def on_files_page_loaded(self, storage_type, generation, items):
+
+        if generation != self.list_generations[storage_type]:
+            return
+
+        if storage_type == 'archive':
+            files_list = self.archive_files_list
+        elif storage_type == 'object':
+            files_list = self.object_files_list
+        else:
+            files_list = self.ncloud_files_list
 
-                list_item.setText(display_text)
-                list_item.setData(Qt.ItemDataRole.UserRole, item)
+        for item in items:
+            list_item = QListWidgetItem()
 
-                list_item.setFlags(list_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                list_item.setCheckState(Qt.CheckState.Unchecked)
+            icon = "📁" if item['type'] == 'folder' else "📄"
+            display_text = f"{icon} {item['name']}"
 
-                files_list.addItem(list_item)
+            if item['type'] == 'file' and item.get('size', 0) > 0:
+                size_text = CompressedUploadThread.format_file_size(item['size'])
+                display_text += f" ({size_text})"
 
-            self.update_path_display()
+                # NCloud Storage에서만 Storage Class 정보 표시
+                if storage_type == 'ncloud' and 'storage_class' in item:
+                    storage_class = item['storage_class']
+                    if storage_class == 'STANDARD':
+                        display_text += " [일반]"
+                    elif storage_class == 'DEEP_ARCHIVE':
+                        display_text += " [아카이브]"
+                    else:
+                        display_text += f" [{storage_class}]"
 
-        except Exception as e:
-            print(f"파일 목록 새로고침 오류: {str(e)}")
+            list_item.setText(display_text)
+            list_item.setData(Qt.ItemDataRole.UserRole, item)
+
+            list_item.setFlags(list_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            list_item.setCheckState(Qt.CheckState.Unchecked)
+
+            files_list.addItem(list_item)
+
+    def on_files_list_failed(self, storage_type, generation, error):
+
+        if generation == self.list_generations[storage_type]:
+            print(f"파일 목록 새로고침 오류: {error}")
 
     def update_path_display(self):
 
@@ -2042,7 +2108,19 @@ class IntegratedStorageGUI(QMainWindow):
         container_or_bucket = self.get_current_container_or_bucket()
 
         success_count = 0
-        for item in selected_items:
+        items_to_delete = selected_items
+
+        if self.current_storage_type == 'archive':
+            file_keys = [item['key'] for item in selected_items if item['type'] == 'file']
+            if file_keys:
+                try:
+                    result = client.delete_objects(container_or_bucket, file_keys)
+                    success_count += len(file_keys) - len(result['errors'])
+                except Exception as e:
+                    print(f"삭제 실패: {str(e)}")
+            items_to_delete = [item for item in selected_items if item['type'] != 'file']
+
+        for item in items_to_delete:
             try:
                 if item['type'] == 'file':
                     success = client.delete_object(container_or_bucket, item['key'])
@@ -2107,11 +2185,34 @@ class IntegratedStorageGUI(QMainWindow):
         clear_btn.clicked.connect(lambda: self.console_text.clear())
         clear_btn.setFixedWidth(80)
         console_btn_layout.addWidget(clear_btn)
+        stats_btn = QPushButton("요청 통계")
+        stats_btn.clicked.connect(self.show_request_stats)
+        stats_btn.setFixedWidth(80)
+        console_btn_layout.addWidget(stats_btn)
+        self.request_stats_label = QLabel("")
+        self.request_stats_label.setStyleSheet("color: #888888; padding: 0 5px;")
+        console_btn_layout.addWidget(self.request_stats_label)
         console_btn_layout.addStretch()
         console_layout.addLayout(console_btn_layout)
 
         main_layout.addWidget(console_group)
 
+    def show_request_stats(self):
+
+        print(self.archive_request_stats.report_text())
+        if self.archive_client and hasattr(self.archive_client.transport, 'pool_stats'):
+            print(self.archive_client.transport.pool_stats.report_text())
+
+    def on_archive_request_recorded(self, record):
+
+        status = record['status'] if record['status'] is not None else '오류'
+        text = f"최근 요청: {record['method']} {record['url_template']} {status}, {record['latency'] * 1000:.0f}ms"
+        if record['ttfb'] is not None:
+            text += f" (첫 바이트 {record['ttfb'] * 1000:.0f}ms)"
+        if record['retries']:
+            text += f", 재시도 {record['retries']}회"
+        self.request_stats_label.setText(text)
+
     def is_dark_mode(self):
 
         palette = self.palette()
@@ -2487,6 +2588,11 @@ class IntegratedStorageGUI(QMainWindow):
                 if self.upload_thread.isRunning():
                     self.upload_thread.terminate()
                     self.upload_thread.wait(1000)
+
+            for thread in list(self.list_threads):
+                thread.cancelled = True
+                if thread.isRunning():
+                    thread.wait(1000)
             
             # 콘솔 출력 복원
             if hasattr(self, 'console_output') and self.console_output is not None:
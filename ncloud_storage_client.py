@@ -6,9 +6,12 @@ from datetime import datetime
 import time
 from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
-from boto3.s3.transfer import TransferConfig
 import logging
 
+from s3_utils import (S3TransferProfile, iter_object_pages, iter_multipart_uploads, iter_parts, multipart_part_size,
+                      multipart_journal, upload_multipart_file)
+from transfer_utils import InFlightBudget, TransferProgress, run_file_transfers
+
 class RealNcloudStorageClient:
 
     def __init__(self):
@@ -19,6 +22,10 @@ class RealNcloudStorageClient:
         self.client = None
         self.connected = False
         self.current_bucket = None
+        self.transfer_budget = InFlightBudget(1024 * 1024 * 1024)
+        self.resume_uploads = False
+        self.journal_dir = os.path.join(os.path.expanduser('~'), '.ncp_storage_manager', 'journals')
+        self.transfer_profile = S3TransferProfile()
 
         logging.getLogger('boto3').setLevel(logging.WARNING)
         logging.getLogger('botocore').setLevel(logging.WARNING)
@@ -37,7 +44,7 @@ class RealNcloudStorageClient:
             config = Config(
                 signature_version='s3v4',
                 retries={'max_attempts': 3, 'mode': 'adaptive'},
-                max_pool_connections=50,
+                max_pool_connections=self.transfer_profile.max_connections,
                 region_name=self.region
             )
 
@@ -74,7 +81,7 @@ class RealNcloudStorageClient:
             config = Config(
                 signature_version='s3v4',
                 retries={'max_attempts': 3, 'mode': 'adaptive'},
-                max_pool_connections=50,
+                max_pool_connections=self.transfer_profile.max_connections,
                 region_name=self.region
             )
 
@@ -148,61 +155,25 @@ class RealNcloudStorageClient:
             print(f"버킷 삭제 실패: {str(e)}")
             return False
 
-    def list_objects(self, bucket_name, prefix='', delimiter=''):
+    def iter_objects(self, bucket_name, prefix='', delimiter='', page_size=1000):
 
         if not self.connected:
-            return []
+            return iter(())
+        return iter_object_pages(self.client, bucket_name, prefix, delimiter, page_size)
 
-        try:
-            kwargs = {
-                'Bucket': bucket_name,
-                'MaxKeys': 1000
-            }
+    def list_objects(self, bucket_name, prefix='', delimiter='', max_items=None):
 
-            if prefix:
-                kwargs['Prefix'] = prefix
-            if delimiter:
-                kwargs['Delimiter'] = delimiter
+        if not self.connected:
+            return []
 
-            response = self.client.list_objects_v2(**kwargs)
+        try:
             objects = []
 
-            if 'CommonPrefixes' in response:
-                for prefix_info in response['CommonPrefixes']:
-                    original_prefix = prefix_info['Prefix']
-                    folder_name = original_prefix.rstrip('/')
-                    if '/' in folder_name:
-                        folder_name = folder_name.split('/')[-1]
-
-                    objects.append({
-                        'name': folder_name,
-                        'size': 0,
-                        'type': 'folder',
-                        'last_modified': None,
-                        'key': original_prefix
-                    })
-
-            if 'Contents' in response:
-                for obj in response['Contents']:
-
-                    if obj['Key'].endswith('/'):
-                        continue
-
-                    file_name = obj['Key']
-                    if prefix and file_name.startswith(prefix):
-                        file_name = file_name[len(prefix):]
-
-                    if '/' in file_name:
-                        continue
-
-                    objects.append({
-                        'name': file_name,
-                        'size': obj['Size'],
-                        'type': 'file',
-                        'last_modified': obj['LastModified'],
-                        'key': obj['Key'],
-                        'storage_class': obj.get('StorageClass', 'STANDARD')
-                    })
+            for page in self.iter_objects(bucket_name, prefix, delimiter):
+                objects.extend(page)
+                if max_items and len(objects) >= max_items:
+                    objects = objects[:max_items]
+                    break
 
             return objects
 
@@ -210,49 +181,31 @@ class RealNcloudStorageClient:
             print(f"객체 목록 조회 실패: {str(e)}")
             return []
 
-    def upload_file(self, local_file_path, bucket_name, object_key, progress_callback=None, storage_class='STANDARD'):
+    def upload_file(self, local_file_path, bucket_name, object_key, progress_callback=None, storage_class='STANDARD',
+                    parallel_files=1):
 
         if not self.connected:
             return False
 
         try:
             file_size = os.path.getsize(local_file_path)
-
-            def upload_callback(bytes_transferred):
-                if progress_callback:
-                    progress = int((bytes_transferred / file_size) * 100)
-                    progress_callback(progress)
+            progress = TransferProgress(file_size, progress_callback)
 
             extra_args = {}
             if storage_class in ['STANDARD', 'DEEP_ARCHIVE']:
                 extra_args['StorageClass'] = storage_class
 
-            if file_size > 5 * 1024 * 1024 * 1024:
-                print(f"대용량 파일 감지 ({self.format_file_size(file_size)}): 멀티파트 업로드 사용")
-                config = TransferConfig(
-                    multipart_threshold=1024 * 1024 * 100,
-                    max_concurrency=10,
-                    multipart_chunksize=1024 * 1024 * 100,
-                    use_threads=True
-                )
-
-                self.client.upload_file(
-                    local_file_path,
-                    bucket_name,
-                    object_key,
-                    Config=config,
-                    Callback=upload_callback,
-                    ExtraArgs=extra_args
-                )
-            else:
+            if file_size >= self.transfer_profile.multipart_threshold:
+                print(f"대용량 파일 감지 ({self.format_file_size(file_size)}): {self.transfer_profile.describe(file_size)}")
 
-                self.client.upload_file(
-                    local_file_path,
-                    bucket_name,
-                    object_key,
-                    Callback=upload_callback,
-                    ExtraArgs=extra_args
-                )
+            self.client.upload_file(
+                local_file_path,
+                bucket_name,
+                object_key,
+                Config=self.transfer_profile.transfer_config(file_size, parallel_files),
+                Callback=progress.add,
+                ExtraArgs=extra_args
+            )
 
             return True
 
@@ -273,10 +226,7 @@ class RealNcloudStorageClient:
             except:
                 file_size = 0
 
-            def download_callback(bytes_transferred):
-                if progress_callback and file_size > 0:
-                    progress = int((bytes_transferred / file_size) * 100)
-                    progress_callback(progress)
+            progress = TransferProgress(file_size, progress_callback)
 
             os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
 
@@ -284,7 +234,8 @@ class RealNcloudStorageClient:
                 bucket_name,
                 object_key,
                 local_file_path,
-                Callback=download_callback
+                Config=self.transfer_profile.transfer_config(file_size),
+                Callback=progress.add
             )
 
             return True
@@ -460,27 +411,27 @@ class RealNcloudStorageClient:
                     else:
                         remote_path = relative_path.replace(os.sep, '/')
 
-                    files_to_upload.append((local_file_path, remote_path))
+                    files_to_upload.append((local_file_path, remote_path, os.path.getsize(local_file_path)))
 
             total_files = len(files_to_upload)
+            workers = self.transfer_profile.file_concurrency(total_files)
+            progress = TransferProgress(sum(size for _, _, size in files_to_upload), progress_callback, report_interval=5)
 
-            success_count = 0
-            for i, (local_file_path, remote_path) in enumerate(files_to_upload):
-                if progress_callback:
-                    progress = int((i / total_files) * 100)
-                    progress_callback(progress)
-
+            def upload_one(index, file_progress_callback):
+                local_file_path, remote_path, file_size = files_to_upload[index]
                 try:
-                    if self.upload_file(local_file_path, bucket_name, remote_path):
-                        success_count += 1
+                    return self.upload_file(local_file_path, bucket_name, remote_path, file_progress_callback,
+                                            parallel_files=workers)
                 except Exception as e:
                     print(f"파일 업로드 실패: {local_file_path} - {str(e)}")
-                    continue
+                    return False
+
+            results = run_file_transfers(progress, [size for _, _, size in files_to_upload], upload_one, workers)
 
             if progress_callback:
                 progress_callback(100)
 
-            return success_count == total_files
+            return sum(results) == total_files
 
         except Exception as e:
             print(f"폴더 업로드 오류: {str(e)}")
@@ -543,64 +494,33 @@ class RealNcloudStorageClient:
 
     def advanced_multipart_upload(self, local_file_path, bucket_name, object_key,
                                  progress_callback=None, storage_class='STANDARD',
-                                 chunk_size=100*1024*1024):
+                                 chunk_size=100*1024*1024, max_workers=None, resume=None):
 
         if not self.connected:
             return False
 
         try:
             file_size = os.path.getsize(local_file_path)
+            chunk_size = multipart_part_size(file_size, chunk_size)
 
             extra_args = {}
             if storage_class in ['STANDARD', 'DEEP_ARCHIVE']:
                 extra_args['StorageClass'] = storage_class
 
+            journal = None
+            if self.resume_uploads if resume is None else resume:
+                journal = multipart_journal(self.journal_dir, local_file_path, self.base_endpoint,
+                                            bucket_name, object_key, chunk_size)
+
+            total_parts = max(1, (file_size + chunk_size - 1) // chunk_size)
+            workers = max(1, min(max_workers or self.transfer_profile.max_concurrency, total_parts))
+
             print(f"멀티파트 업로드 시작: {object_key}")
-            response = self.client.create_multipart_upload(
-                Bucket=bucket_name,
-                Key=object_key,
-                **extra_args
-            )
-            upload_id = response['UploadId']
-            print(f"업로드 ID: {upload_id}")
+            print(f"파트 {total_parts}개, 파트 크기 {chunk_size // (1024 * 1024)} MB, 동시 업로드 {workers}")
 
-            parts = []
-            part_number = 1
-            bytes_uploaded = 0
-
-            with open(local_file_path, 'rb') as f:
-                while True:
-                    chunk = f.read(chunk_size)
-                    if not chunk:
-                        break
-
-                    print(f"파트 {part_number} 업로드 중...")
-                    part_response = self.client.upload_part(
-                        Bucket=bucket_name,
-                        Key=object_key,
-                        PartNumber=part_number,
-                        UploadId=upload_id,
-                        Body=chunk
-                    )
-
-                    parts.append({
-                        'ETag': part_response['ETag'],
-                        'PartNumber': part_number
-                    })
-
-                    bytes_uploaded += len(chunk)
-                    if progress_callback:
-                        progress = int((bytes_uploaded / file_size) * 100)
-                        progress_callback(progress)
-
-                    part_number += 1
-
-            print("멀티파트 업로드 완료 중...")
-            self.client.complete_multipart_upload(
-                Bucket=bucket_name,
-                Key=object_key,
-                UploadId=upload_id,
-                MultipartUpload={'Parts': parts}
+            upload_multipart_file(
+                self.client, bucket_name, object_key, local_file_path, chunk_size, self.transfer_budget,
+                workers, progress_callback, extra_args, journal
             )
 
             print(f"멀티파트 업로드 성공: {object_key}")
@@ -608,17 +528,6 @@ class RealNcloudStorageClient:
 
         except Exception as e:
             print(f"멀티파트 업로드 오류: {str(e)}")
-
-            try:
-                if 'upload_id' in locals():
-                    self.client.abort_multipart_upload(
-                        Bucket=bucket_name,
-                        Key=object_key,
-                        UploadId=upload_id
-                    )
-                    print("중단된 멀티파트 업로드 정리 완료")
-            except:
-                pass
             return False
 
     def list_multipart_uploads(self, bucket_name):
@@ -627,17 +536,15 @@ class RealNcloudStorageClient:
             return []
 
         try:
-            response = self.client.list_multipart_uploads(Bucket=bucket_name)
             uploads = []
 
-            if 'Uploads' in response:
-                for upload in response['Uploads']:
-                    uploads.append({
-                        'key': upload['Key'],
-                        'upload_id': upload['UploadId'],
-                        'initiated': upload['Initiated'],
-                        'storage_class': upload.get('StorageClass', 'STANDARD')
-                    })
+            for upload in iter_multipart_uploads(self.client, bucket_name):
+                uploads.append({
+                    'key': upload['Key'],
+                    'upload_id': upload['UploadId'],
+                    'initiated': upload['Initiated'],
+                    'storage_class': upload.get('StorageClass', 'STANDARD')
+                })
 
             return uploads
 
@@ -651,21 +558,15 @@ class RealNcloudStorageClient:
             return []
 
         try:
-            response = self.client.list_parts(
-                Bucket=bucket_name,
-                Key=object_key,
-                UploadId=upload_id
-            )
-
             parts = []
-            if 'Parts' in response:
-                for part in response['Parts']:
-                    parts.append({
-                        'part_number': part['PartNumber'],
-                        'etag': part['ETag'],
-                        'size': part['Size'],
-                        'last_modified': part['LastModified']
-                    })
+
+            for part in iter_parts(self.client, bucket_name, object_key, upload_id):
+                parts.append({
+                    'part_number': part['PartNumber'],
+                    'etag': part['ETag'],
+                    'size': part['Size'],
+                    'last_modified': part['LastModified']
+                })
 
             return parts
 
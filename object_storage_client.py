@@ -3,9 +3,11 @@ import os
 import logging
 from botocore.exceptions import ClientError, NoCredentialsError
 from botocore.config import Config
-from boto3.s3.transfer import TransferConfig
 import threading
 
+from s3_utils import S3TransferProfile, iter_object_pages, multipart_journal, upload_multipart_file
+from transfer_utils import InFlightBudget, TransferProgress, run_file_transfers
+
 class ObjectStorageClient:
 
     def __init__(self):
@@ -15,6 +17,10 @@ class ObjectStorageClient:
         self.region_name = "kr-standard"
         self.s3_client = None
         self.s3_resource = None
+        self.transfer_profile = S3TransferProfile()
+        self.transfer_budget = InFlightBudget(1024 * 1024 * 1024)
+        self.resume_uploads = False
+        self.journal_dir = os.path.join(os.path.expanduser('~'), '.ncp_storage_manager', 'journals')
 
         logging.getLogger('boto3').setLevel(logging.WARNING)
         logging.getLogger('botocore').setLevel(logging.WARNING)
@@ -30,7 +36,7 @@ class ObjectStorageClient:
                 'max_attempts': 3,
                 'mode': 'adaptive'
             },
-            max_pool_connections=50,
+            max_pool_connections=self.transfer_profile.max_connections,
             connect_timeout=60,
             read_timeout=300
         )
@@ -117,55 +123,19 @@ class ObjectStorageClient:
             print(f"버킷 목록 조회 실패: {str(e)}")
             return []
 
-    def list_objects(self, bucket_name, prefix='', delimiter=''):
+    def iter_objects(self, bucket_name, prefix='', delimiter='', page_size=1000):
+        return iter_object_pages(self.s3_client, bucket_name, prefix, delimiter, page_size)
 
-        try:
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-
-            page_iterator = paginator.paginate(
-                Bucket=bucket_name,
-                Prefix=prefix,
-                Delimiter=delimiter
-            )
+    def list_objects(self, bucket_name, prefix='', delimiter='', max_items=None):
 
+        try:
             objects = []
 
-            for page in page_iterator:
-
-                if 'CommonPrefixes' in page:
-                    for prefix_info in page['CommonPrefixes']:
-                        folder_name = prefix_info['Prefix'].rstrip('/')
-                        if '/' in folder_name:
-                            folder_name = folder_name.split('/')[-1]
-
-                        objects.append({
-                            'name': folder_name,
-                            'size': 0,
-                            'type': 'folder',
-                            'last_modified': None,
-                            'key': prefix_info['Prefix']
-                        })
-
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-
-                        if obj['Key'].endswith('/'):
-                            continue
-
-                        file_name = obj['Key']
-                        if prefix and file_name.startswith(prefix):
-                            file_name = file_name[len(prefix):]
-
-                        if '/' in file_name:
-                            continue
-
-                        objects.append({
-                            'name': file_name,
-                            'size': obj['Size'],
-                            'type': 'file',
-                            'last_modified': obj['LastModified'],
-                            'key': obj['Key']
-                        })
+            for page in self.iter_objects(bucket_name, prefix, delimiter):
+                objects.extend(page)
+                if max_items and len(objects) >= max_items:
+                    objects = objects[:max_items]
+                    break
 
             print(f"객체 목록 조회 성공: {len(objects)}개")
             return objects
@@ -174,7 +144,7 @@ class ObjectStorageClient:
             print(f"객체 목록 조회 실패: {str(e)}")
             return []
 
-    def upload_file(self, bucket_name, object_key, file_path, progress_callback=None):
+    def upload_file(self, bucket_name, object_key, file_path, progress_callback=None, parallel_files=1, resume=None):
 
         try:
             if not os.path.exists(file_path):
@@ -202,27 +172,27 @@ class ObjectStorageClient:
             if progress_callback:
                 callback = ProgressCallback(progress_callback, file_size)
 
-            if file_size > 100 * 1024 * 1024:
-                print("멀티파트 업로드 사용")
-                self.s3_client.upload_file(
-                    file_path,
-                    bucket_name,
-                    object_key,
-                    Callback=callback,
-                    Config=TransferConfig(
-                        multipart_threshold=1024 * 25,
-                        max_concurrency=10,
-                        multipart_chunksize=1024 * 25,
-                        use_threads=True
+            if file_size >= self.transfer_profile.multipart_threshold:
+                print(f"멀티파트 업로드 사용: {self.transfer_profile.describe(file_size)}")
+
+                if self.resume_uploads if resume is None else resume:
+                    part_size = self.transfer_profile.part_size(file_size)
+                    upload_multipart_file(
+                        self.s3_client, bucket_name, object_key, file_path, part_size, self.transfer_budget,
+                        self.transfer_profile.concurrency(file_size, parallel_files), progress_callback,
+                        journal=multipart_journal(self.journal_dir, file_path, self.endpoint_url,
+                                                  bucket_name, object_key, part_size)
                     )
-                )
-            else:
-                self.s3_client.upload_file(
-                    file_path,
-                    bucket_name,
-                    object_key,
-                    Callback=callback
-                )
+                    print(f"파일 업로드 성공: {object_key}")
+                    return True
+
+            self.s3_client.upload_file(
+                file_path,
+                bucket_name,
+                object_key,
+                Callback=callback,
+                Config=self.transfer_profile.transfer_config(file_size, parallel_files)
+            )
 
             print(f"파일 업로드 성공: {object_key}")
             return True
@@ -270,7 +240,8 @@ class ObjectStorageClient:
                 bucket_name,
                 object_key,
                 local_path,
-                Callback=callback
+                Callback=callback,
+                Config=self.transfer_profile.transfer_config(file_size)
             )
 
             print(f"파일 다운로드 성공: {local_path}")
@@ -318,34 +289,35 @@ class ObjectStorageClient:
                     else:
                         remote_key = relative_path
                     
-                    files_to_upload.append((local_file_path, remote_key))
+                    files_to_upload.append((local_file_path, remote_key, os.path.getsize(local_file_path)))
 
             total_files = len(files_to_upload)
             if total_files == 0:
                 print("업로드할 파일이 없습니다")
                 return True
 
-            print(f"폴더 업로드 시작: {total_files}개 파일")
-            
-            success_count = 0
-            for i, (local_file_path, remote_key) in enumerate(files_to_upload):
-                if progress_callback:
-                    progress = int((i / total_files) * 100)
-                    progress_callback(progress)
+            workers = self.transfer_profile.file_concurrency(total_files)
+            print(f"폴더 업로드 시작: {total_files}개 파일, 동시 업로드: {workers}")
+
+            progress = TransferProgress(sum(size for _, _, size in files_to_upload), progress_callback, report_interval=5)
 
+            def upload_one(index, file_progress_callback):
+                local_file_path, remote_key, file_size = files_to_upload[index]
                 try:
-                    if self.upload_file(bucket_name, remote_key, local_file_path):
-                        success_count += 1
-                        print(f"업로드 성공 ({i+1}/{total_files}): {remote_key}")
-                    else:
-                        print(f"업로드 실패: {remote_key}")
+                    if self.upload_file(bucket_name, remote_key, local_file_path, file_progress_callback, workers):
+                        print(f"업로드 성공 ({index+1}/{total_files}): {remote_key}")
+                        return True
+                    print(f"업로드 실패: {remote_key}")
                 except Exception as e:
                     print(f"파일 업로드 실패: {local_file_path} - {str(e)}")
-                    continue
+                return False
+
+            results = run_file_transfers(progress, [size for _, _, size in files_to_upload], upload_one, workers)
 
             if progress_callback:
                 progress_callback(100)
 
+            success_count = sum(results)
             print(f"폴더 업로드 완료: {success_count}/{total_files} 파일 성공")
             return success_count == total_files
 
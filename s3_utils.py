@@ -0,0 +1,346 @@
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from boto3.s3.transfer import TransferConfig
+
+from transfer_utils import FilePartReader, TransferJournal, TransferProgress
+
+
+MB = 1024 * 1024
+
+S3_MIN_PART_SIZE = 5 * MB
+S3_MAX_PART_SIZE = 5 * 1024 * MB
+S3_MAX_PARTS = 10000
+
+
+class S3TransferProfile:
+
+    def __init__(self, multipart_threshold=64 * MB, min_part_size=8 * MB, max_part_size=512 * MB,
+                 target_parts=1000, max_concurrency=10, max_file_concurrency=8, max_connections=50):
+        self.multipart_threshold = max(multipart_threshold, S3_MIN_PART_SIZE)
+        self.min_part_size = min(max(min_part_size, S3_MIN_PART_SIZE), S3_MAX_PART_SIZE)
+        self.max_part_size = min(max(max_part_size, self.min_part_size), S3_MAX_PART_SIZE)
+        self.target_parts = min(max(target_parts, 1), S3_MAX_PARTS)
+        self.max_concurrency = max(max_concurrency, 1)
+        self.max_file_concurrency = max(max_file_concurrency, 1)
+        self.max_connections = max(max_connections, self.max_concurrency)
+
+    def part_size(self, object_size):
+
+        part_size = min(max(-(-object_size // self.target_parts), self.min_part_size), self.max_part_size)
+        part_size = max(part_size, -(-object_size // S3_MAX_PARTS))
+        return min(-(-part_size // MB) * MB, S3_MAX_PART_SIZE)
+
+    def part_count(self, object_size):
+        return max(1, -(-object_size // self.part_size(object_size)))
+
+    def concurrency(self, object_size, parallel_files=1):
+
+        if object_size < self.multipart_threshold:
+            return 1
+
+        share = max(1, self.max_connections // max(parallel_files, 1))
+        return max(1, min(self.max_concurrency, share, self.part_count(object_size)))
+
+    def file_concurrency(self, total_files):
+        return max(1, min(self.max_file_concurrency, total_files))
+
+    def transfer_config(self, object_size, parallel_files=1):
+
+        return TransferConfig(
+            multipart_threshold=self.multipart_threshold,
+            multipart_chunksize=self.part_size(object_size),
+            max_concurrency=self.concurrency(object_size, parallel_files),
+            use_threads=True
+        )
+
+    def describe(self, object_size):
+
+        if object_size < self.multipart_threshold:
+            return "단일 요청"
+        return (f"멀티파트 {self.part_count(object_size)}개 파트, "
+                f"파트 크기 {self.part_size(object_size) // MB} MB, 동시 전송 {self.concurrency(object_size)}")
+
+    @classmethod
+    def from_config(cls, config):
+
+        config = config or {}
+        kwargs = {}
+        for key, name, scale in [
+            ('multipart_threshold_mb', 'multipart_threshold', MB),
+            ('min_part_size_mb', 'min_part_size', MB),
+            ('max_part_size_mb', 'max_part_size', MB),
+            ('target_parts', 'target_parts', 1),
+            ('max_concurrency', 'max_concurrency', 1),
+            ('max_file_concurrency', 'max_file_concurrency', 1),
+            ('max_connections', 'max_connections', 1)
+        ]:
+            if key not in config:
+                continue
+            try:
+                kwargs[name] = int(float(config[key]) * scale)
+            except (TypeError, ValueError):
+                print(f"전송 설정 값이 올바르지 않습니다: {key}={config[key]}")
+
+        return cls(**kwargs)
+
+
+def multipart_part_size(file_size, part_size):
+    return min(max(part_size, -(-file_size // S3_MAX_PARTS), S3_MIN_PART_SIZE), S3_MAX_PART_SIZE)
+
+
+def upload_parts(s3_client, bucket_name, object_key, upload_id, file_path, part_size, part_numbers,
+                 budget, max_workers=4, progress=None, on_part=None):
+
+    file_size = os.path.getsize(file_path)
+    stop_event = threading.Event()
+    etags = {}
+
+    def upload_part(part_number):
+        if stop_event.is_set():
+            return
+
+        offset = (part_number - 1) * part_size
+        length = min(part_size, file_size - offset)
+
+        # 재시도는 boto3 클라이언트 설정(retries)에 맡김
+        with FilePartReader(file_path, offset, length, budget) as part_body:
+            response = s3_client.upload_part(
+                Bucket=bucket_name,
+                Key=object_key,
+                PartNumber=part_number,
+                UploadId=upload_id,
+                Body=part_body,
+                ContentLength=length
+            )
+
+        etags[part_number] = response['ETag']
+        if on_part:
+            on_part(part_number, response['ETag'], length)
+        if progress:
+            progress.add(length)
+
+    part_numbers = list(part_numbers)
+    if not part_numbers:
+        return etags
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(part_numbers)))) as executor:
+        futures = [executor.submit(upload_part, part_number) for part_number in part_numbers]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except Exception:
+            stop_event.set()
+            for future in futures:
+                future.cancel()
+            raise
+
+    return etags
+
+
+def completed_parts(etags):
+    return [{'ETag': etags[part_number], 'PartNumber': part_number} for part_number in sorted(etags)]
+
+
+def iter_multipart_uploads(s3_client, bucket_name, prefix=''):
+
+    kwargs = {'Bucket': bucket_name}
+    if prefix:
+        kwargs['Prefix'] = prefix
+
+    while True:
+        response = s3_client.list_multipart_uploads(**kwargs)
+        for upload in response.get('Uploads', []):
+            yield upload
+
+        if not response.get('IsTruncated'):
+            return
+        kwargs['KeyMarker'] = response.get('NextKeyMarker', '')
+        kwargs['UploadIdMarker'] = response.get('NextUploadIdMarker', '')
+
+
+def iter_parts(s3_client, bucket_name, object_key, upload_id):
+
+    kwargs = {'Bucket': bucket_name, 'Key': object_key, 'UploadId': upload_id}
+
+    while True:
+        response = s3_client.list_parts(**kwargs)
+        for part in response.get('Parts', []):
+            yield part
+
+        if not response.get('IsTruncated'):
+            return
+        kwargs['PartNumberMarker'] = response['NextPartNumberMarker']
+
+
+def multipart_journal(journal_dir, file_path, endpoint, bucket_name, object_key, part_size):
+
+    return TransferJournal(journal_dir, 's3_multipart', {
+        'file_path': os.path.abspath(file_path),
+        'file_size': os.path.getsize(file_path),
+        'file_mtime_ns': os.stat(file_path).st_mtime_ns,
+        'endpoint': endpoint,
+        'bucket': bucket_name,
+        'key': object_key,
+        'part_size': part_size
+    })
+
+
+def _find_resumable_parts(s3_client, bucket_name, object_key, file_size, part_size, journal_entries):
+
+    upload_id = journal_entries.get('upload_id')
+    if not upload_id:
+        return None, {}
+
+    in_progress = any(upload['Key'] == object_key and upload['UploadId'] == upload_id
+                      for upload in iter_multipart_uploads(s3_client, bucket_name, object_key))
+    if not in_progress:
+        return None, {}
+
+    etags = {}
+    for part in iter_parts(s3_client, bucket_name, object_key, upload_id):
+        part_number = part['PartNumber']
+        expected_size = min(part_size, file_size - (part_number - 1) * part_size)
+        recorded = journal_entries.get(part_number)
+
+        # 현재 파일 기준 크기와 기록된 ETag가 모두 일치하는 파트만 재사용
+        if recorded and part['Size'] == expected_size and part['ETag'] == recorded['etag']:
+            etags[part_number] = part['ETag']
+
+    return upload_id, etags
+
+
+def upload_multipart_file(s3_client, bucket_name, object_key, file_path, part_size, budget, max_workers=4,
+                          progress_callback=None, extra_args=None, journal=None):
+
+    file_size = os.path.getsize(file_path)
+    total_parts = max(1, -(-file_size // part_size))
+    progress = TransferProgress(file_size, progress_callback)
+
+    upload_id = None
+    etags = {}
+    if journal:
+        upload_id, etags = _find_resumable_parts(s3_client, bucket_name, object_key, file_size, part_size,
+                                                 journal.load())
+
+    if upload_id:
+        print(f"이어 올리기: {len(etags)}/{total_parts}개 파트가 이미 업로드되어 있습니다 (업로드 ID: {upload_id})")
+        entries = {part_number: {'etag': etag} for part_number, etag in etags.items()}
+        entries['upload_id'] = upload_id
+        journal.start(entries)
+        for part_number in etags:
+            progress.add(min(part_size, file_size - (part_number - 1) * part_size))
+    else:
+        response = s3_client.create_multipart_upload(Bucket=bucket_name, Key=object_key, **(extra_args or {}))
+        upload_id = response['UploadId']
+        print(f"업로드 ID: {upload_id}")
+        if journal:
+            journal.start({'upload_id': upload_id})
+
+    def record_part(part_number, etag, length):
+        if journal:
+            journal.record(part_number, {'etag': etag})
+
+    try:
+        etags.update(upload_parts(
+            s3_client, bucket_name, object_key, upload_id, file_path, part_size,
+            [part_number for part_number in range(1, total_parts + 1) if part_number not in etags],
+            budget, max_workers, progress, record_part
+        ))
+
+        print("멀티파트 업로드 완료 중...")
+        s3_client.complete_multipart_upload(
+            Bucket=bucket_name,
+            Key=object_key,
+            UploadId=upload_id,
+            MultipartUpload={'Parts': completed_parts(etags)}
+        )
+
+    except Exception:
+        if journal:
+            print(f"업로드된 파트를 보존합니다. 다시 업로드하면 이어서 진행합니다 (업로드 ID: {upload_id})")
+        else:
+            try:
+                s3_client.abort_multipart_upload(Bucket=bucket_name, Key=object_key, UploadId=upload_id)
+                print("중단된 멀티파트 업로드 정리 완료")
+            except Exception:
+                pass
+        raise
+
+    if journal:
+        journal.remove()
+
+
+def load_transfer_profile(config_file='config.json', storage_type=None):
+
+    try:
+        if not os.path.exists(config_file):
+            return S3TransferProfile()
+
+        with open(config_file, 'r', encoding='utf-8') as f:
+            all_config = json.load(f)
+
+        profile_config = dict(all_config.get('transfer_profile', {})) if isinstance(all_config, dict) else {}
+        if storage_type and isinstance(profile_config.get(storage_type), dict):
+            profile_config.update(profile_config[storage_type])
+
+        return S3TransferProfile.from_config(profile_config)
+
+    except Exception as e:
+        print(f"전송 설정 로드 오류: {str(e)}")
+        return S3TransferProfile()
+
+
+def iter_object_pages(s3_client, bucket_name, prefix='', delimiter='', page_size=1000):
+
+    kwargs = {'Bucket': bucket_name, 'MaxKeys': page_size}
+    if prefix:
+        kwargs['Prefix'] = prefix
+    if delimiter:
+        kwargs['Delimiter'] = delimiter
+
+    while True:
+        response = s3_client.list_objects_v2(**kwargs)
+        entries = []
+
+        for prefix_info in response.get('CommonPrefixes', []):
+            folder_name = prefix_info['Prefix'].rstrip('/')
+            if '/' in folder_name:
+                folder_name = folder_name.split('/')[-1]
+
+            entries.append({
+                'name': folder_name,
+                'size': 0,
+                'type': 'folder',
+                'last_modified': None,
+                'key': prefix_info['Prefix']
+            })
+
+        for obj in response.get('Contents', []):
+
+            if obj['Key'].endswith('/'):
+                continue
+
+            file_name = obj['Key']
+            if prefix and file_name.startswith(prefix):
+                file_name = file_name[len(prefix):]
+
+            if delimiter and delimiter in file_name:
+                continue
+
+            entries.append({
+                'name': file_name,
+                'size': obj['Size'],
+                'type': 'file',
+                'last_modified': obj['LastModified'],
+                'key': obj['Key'],
+                'storage_class': obj.get('StorageClass', 'STANDARD')
+            })
+
+        yield entries
+
+        if not response.get('IsTruncated') or not response.get('NextContinuationToken'):
+            return
+        kwargs['ContinuationToken'] = response['NextContinuationToken']
@@ -1,47 +1,219 @@
 import requests
 import json
+import hashlib
 import os
+import stat
 from typing import Optional, Dict, List
-from datetime import datetime
+from datetime import datetime, timezone
 import time
 import urllib3
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 from urllib3.exceptions import InsecureRequestWarning
 import ssl
+import threading
+import tarfile
+from urllib.parse import quote, unquote
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from requests.utils import super_len
+from archive_metrics import url_template
+from http_transport import create_transport
+from transfer_utils import (TransferProgress, FilePartReader, InFlightBudget, TransferJournal,
+                            RetryPolicy, TransferStatusError, run_file_transfers)
 
 urllib3.disable_warnings(InsecureRequestWarning)
 
+class KeystoneTokenManager:
+
+    def __init__(self, fetch_token, refresh_margin=300):
+        self._fetch_token = fetch_token
+        self.refresh_margin = refresh_margin
+        self.token = None
+        self.expires_at = None
+        self.refresh_count = 0
+        self.cache_path = None
+        self.cache_key = None
+        self._lock = threading.Lock()
+
+    def _is_valid(self, token, expires_at):
+
+        if not token:
+            return False
+        if expires_at is None:
+            return True
+        return time.time() < expires_at - self.refresh_margin
+
+    def current_token(self):
+
+        token = self.token
+        return token if self._is_valid(token, self.expires_at) else None
+
+    def get_token(self, force=False):
+
+        token = self.token
+        if not force and self._is_valid(token, self.expires_at):
+            return token
+
+        with self._lock:
+            if not force and self._is_valid(self.token, self.expires_at):
+                return self.token
+
+            if not force and self.token is None and self._load_cached_token():
+                return self.token
+
+            return self._refresh_locked()
+
+    def refresh(self, stale_token=None):
+
+        with self._lock:
+            if stale_token is not None and self.token != stale_token and self._is_valid(self.token, self.expires_at):
+                return self.token
+
+            return self._refresh_locked()
+
+    def reset(self):
+
+        with self._lock:
+            self.token = None
+            self.expires_at = None
+
+    def _refresh_locked(self):
+
+        result = self._fetch_token()
+        if not result:
+            self.token = None
+            self.expires_at = None
+            return None
+
+        self.token, self.expires_at = result
+        self.refresh_count += 1
+        self._save_cached_token()
+        return self.token
+
+    @staticmethod
+    def parse_expires_at(value):
+
+        if not value:
+            return None
+
+        try:
+            value = value.strip()
+            if value.endswith('Z'):
+                value = value[:-1] + '+00:00'
+            parsed = datetime.fromisoformat(value)
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.timestamp()
+        except ValueError:
+            return None
+
+    def _load_cached_token(self):
+
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return False
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+
+            if cached.get('cache_key') != self.cache_key:
+                return False
+            if cached.get('expires_at') is None or not self._is_valid(cached.get('token'), cached.get('expires_at')):
+                return False
+
+            self.token = cached['token']
+            self.expires_at = cached['expires_at']
+            print("저장된 인증 토큰 사용")
+            return True
+
+        except Exception as e:
+            print(f"토큰 캐시 읽기 오류: {str(e)}")
+            return False
+
+    def _save_cached_token(self):
+
+        if not self.cache_path or self.expires_at is None:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            fd = os.open(self.cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'cache_key': self.cache_key,
+                    'token': self.token,
+                    'expires_at': self.expires_at
+                }, f)
+        except Exception as e:
+            print(f"토큰 캐시 저장 오류: {str(e)}")
+
 class NaverArchiveStorageClient:
 
-    def __init__(self):
+    def __init__(self, transport=None):
         self.auth_url = "https://kr.archive.ncloudstorage.com:5000"
         self.storage_url = "https://kr.archive.ncloudstorage.com"
-        self.token = None
+        self.token_manager = KeystoneTokenManager(self._request_token)
         self.access_key = None
         self.secret_key = None
         self.domain_id = None
         self.project_id = None
+        self.slo_threshold = 256 * 1024 * 1024
+        self.segment_size = 100 * 1024 * 1024
+        self.max_auto_segment_size = 1024 * 1024 * 1024
+        self.max_manifest_segments = 1000
+        self.segment_workers = 4
+        self.dedup_segments = False
+        self.dedup_prefix = '_dedup'
+        self.transfer_budget = InFlightBudget(1024 * 1024 * 1024)
+        self.resume_uploads = True
+        self.parallel_download_threshold = 256 * 1024 * 1024
+        self.download_chunk_size = 64 * 1024 * 1024
+        self.download_workers = 4
+        self.request_workers = 8
+        self.bulk_delete_batch_size = 10000
+        self.use_extract_archive = False
+        self.extract_archive_max_file_size = 100 * 1024 * 1024
+        self.extract_archive_batch_files = 10000
+        self.extract_archive_batch_bytes = 1024 * 1024 * 1024
+        self.folder_upload_workers = 4
+        self.journal_dir = os.path.join(os.path.expanduser('~'), '.ncp_storage_manager', 'journals')
+
+        self.retry_policy = RetryPolicy(
+            network_errors=(requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                            requests.exceptions.ChunkedEncodingError)
+        )
 
-        self.session = requests.Session()
+        self.transport = create_transport(transport, pool_maxsize=self.connection_pool_size())
+        self.request_observers = []
 
-        self.session.verify = True
+    @property
+    def token(self):
+        return self.token_manager.token
 
-        retry_strategy = Retry(
-            total=5,
-            backoff_factor=2,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"]
-        )
+    def connection_pool_size(self):
 
-        adapter = HTTPAdapter(
-            max_retries=retry_strategy,
-            pool_connections=20,
-            pool_maxsize=20,
-            pool_block=False
-        )
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        transfer_workers = max(self.segment_workers * self.folder_upload_workers, self.download_workers,
+                               self.request_workers, self.folder_upload_workers)
+        return transfer_workers + 4
+
+    def set_concurrency(self, segment_workers=None, download_workers=None, request_workers=None,
+                        folder_upload_workers=None):
+
+        if segment_workers is not None:
+            self.segment_workers = segment_workers
+        if download_workers is not None:
+            self.download_workers = download_workers
+        if request_workers is not None:
+            self.request_workers = request_workers
+        if folder_upload_workers is not None:
+            self.folder_upload_workers = folder_upload_workers
+
+        if hasattr(self.transport, 'resize'):
+            self.transport.resize(self.connection_pool_size())
+
+    def get_pool_stats(self):
+
+        pool_stats = getattr(self.transport, 'pool_stats', None)
+        return pool_stats.snapshot() if pool_stats is not None else {}
 
     def set_credentials(self, access_key, secret_key, domain_id, project_id):
         self.access_key = access_key
@@ -49,6 +221,14 @@ class NaverArchiveStorageClient:
         self.domain_id = domain_id
         self.project_id = project_id
 
+        self.token_manager.reset()
+        self.token_manager.cache_key = hashlib.sha256(
+            f"{self.auth_url}|{domain_id}|{project_id}|{access_key}|{secret_key}".encode('utf-8')
+        ).hexdigest()
+
+    def set_token_cache(self, cache_path):
+        self.token_manager.cache_path = cache_path
+
     def test_connection(self):
 
         try:
@@ -72,7 +252,11 @@ class NaverArchiveStorageClient:
             print(f"Archive Storage 연결 테스트 오류: {str(e)}")
             return False
 
-    def get_token(self):
+    def get_token(self, force=False):
+
+        return self.token_manager.get_token(force=force) is not None
+
+    def _request_token(self):
 
         headers = {
             'Content-Type': 'application/json'
@@ -98,47 +282,160 @@ class NaverArchiveStorageClient:
             }
         }
 
+        auth_url = f"{self.auth_url}/v3/auth/tokens"
+        body = json.dumps(data)
+        started = time.monotonic()
+        attempts = [0]
+
+        def send():
+            attempts[0] += 1
+            return self.transport.request('POST', auth_url, headers=headers, data=body, timeout=30)
+
         try:
-            response = self.session.post(
-                f"{self.auth_url}/v3/auth/tokens",
-                headers=headers,
-                data=json.dumps(data),
-                timeout=30
-            )
+            try:
+                response = self.retry_policy.call(send, '인증 요청')
+            except Exception as e:
+                self._notify_request('POST', auth_url, None, len(body), started, attempts[0], error=e)
+                raise
+            self._notify_request('POST', auth_url, None, len(body), started, attempts[0], response=response)
 
             print(f"인증 응답 상태 코드: {response.status_code}")
 
             if response.status_code == 201:
-                self.token = response.headers.get('X-Subject-Token')
+                token = response.headers.get('X-Subject-Token')
+                try:
+                    expires_at = KeystoneTokenManager.parse_expires_at(response.json()['token']['expires_at'])
+                except (ValueError, KeyError, TypeError):
+                    expires_at = None
                 print(f"토큰 생성 성공")
-                return True
+                return token, expires_at
             else:
                 print(f"토큰 생성 실패: {response.status_code} - {response.text}")
-                return False
+                return None
 
         except Exception as e:
             print(f"토큰 생성 오류: {str(e)}")
-            return False
+            return None
+
+    def _make_request(self, method, url, retry=True, retry_budget=None, **kwargs):
 
-    def _make_request(self, method, url, **kwargs):
+        headers = dict(kwargs.get('headers') or {})
+        kwargs['headers'] = headers
 
-        if not self.token:
-            if not self.get_token():
+        body = kwargs.get('data')
+        body_position = None
+        if hasattr(body, 'seek') and hasattr(body, 'tell'):
+            body_position = body.tell()
+        replayable = body is None or isinstance(body, (bytes, str)) or body_position is not None
+        bytes_sent = self._body_size(body) if self.request_observers else None
+        started = time.monotonic()
+        attempts = [0]
+
+        def send():
+            token = self.token_manager.get_token()
+            if not token:
                 raise Exception("인증 토큰을 얻을 수 없습니다")
 
-        headers = kwargs.get('headers', {})
-        headers.update({
-            'X-Auth-Token': self.token
-        })
-        kwargs['headers'] = headers
+            if body_position is not None:
+                body.seek(body_position)
+            headers['X-Auth-Token'] = token
+            attempts[0] += 1
+            response = self.transport.request(method, url, **kwargs)
+
+            if response.status_code == 401 and replayable:
+                print("인증 토큰 만료: 토큰 재발급 후 요청 재시도")
+                response.close()
+                token = self.token_manager.refresh(token)
+                if not token:
+                    raise Exception("인증 토큰을 얻을 수 없습니다")
+                if body_position is not None:
+                    body.seek(body_position)
+                headers['X-Auth-Token'] = token
+                attempts[0] += 1
+                response = self.transport.request(method, url, **kwargs)
 
-        try:
-            response = self.session.request(method, url, **kwargs)
             return response
+
+        try:
+            if retry and replayable:
+                response = self.retry_policy.call(
+                    send, f"{method} 요청",
+                    time_budget=retry_budget or self.retry_policy.budget_for_timeout(kwargs.get('timeout'))
+                )
+            else:
+                response = send()
         except Exception as e:
             print(f"요청 오류: {str(e)}")
+            self._notify_request(method, url, kwargs.get('params'), bytes_sent, started, attempts[0], error=e)
             raise
 
+        self._notify_request(method, url, kwargs.get('params'), bytes_sent, started, attempts[0], response=response,
+                             stream=kwargs.get('stream', False))
+        return response
+
+    def add_request_observer(self, observer):
+        self.request_observers.append(observer)
+
+    def remove_request_observer(self, observer):
+        if observer in self.request_observers:
+            self.request_observers.remove(observer)
+
+    @staticmethod
+    def _body_size(body):
+
+        if body is None:
+            return 0
+        if isinstance(body, str):
+            return len(body.encode('utf-8'))
+        if isinstance(body, bytes):
+            return len(body)
+        if hasattr(body, 'read'):
+            return super_len(body)
+        return None
+
+    def _notify_request(self, method, url, params, bytes_sent, started, attempts, response=None, error=None, stream=False):
+
+        observers = list(self.request_observers)
+        if not observers:
+            return
+
+        latency = time.monotonic() - started
+
+        status = None
+        ttfb = None
+        bytes_received = None
+        if response is not None:
+            status = response.status_code
+            elapsed = getattr(response, 'elapsed', None)
+            ttfb = elapsed.total_seconds() if elapsed is not None else None
+            if method == 'HEAD':
+                bytes_received = 0
+            elif stream:
+                content_length = response.headers.get('content-length')
+                bytes_received = int(content_length) if content_length and content_length.isdigit() else None
+            else:
+                bytes_received = len(response.content)
+
+        record = {
+            'timestamp': time.time(),
+            'method': method,
+            'host': url.split('/', 3)[2] if '://' in url else '',
+            'url_template': url_template(url, params),
+            'status': status,
+            'error': str(error) if error is not None else None,
+            'bytes_sent': bytes_sent,
+            'bytes_received': bytes_received,
+            'ttfb': ttfb,
+            'latency': latency,
+            'retries': max(attempts - 1, 0)
+        }
+
+        for observer in observers:
+            try:
+                observer(record)
+            except Exception as e:
+                print(f"요청 기록 오류: {str(e)}")
+
     def upload_file(self, container_name, object_name, file_path, progress_callback=None):
 
         try:
@@ -151,10 +448,8 @@ class NaverArchiveStorageClient:
             file_size = os.path.getsize(file_path)
             print(f"파일 크기: {self.format_file_size(file_size)}")
 
-            slo_threshold = 5 * 1024 * 1024 * 1024
-
-            if file_size > slo_threshold:
-                print(f"대용량 파일 감지: SLO (Static Large Objects) 업로드 사용")
+            if file_size > self.slo_threshold:
+                print(f"대용량 파일 감지 (> {self.format_file_size(self.slo_threshold)}): SLO (Static Large Objects) 업로드 사용")
                 return self.upload_large_file_slo(container_name, object_name, file_path, progress_callback)
             else:
                 return self.upload_small_file_simple(container_name, object_name, file_path, progress_callback)
@@ -170,61 +465,44 @@ class NaverArchiveStorageClient:
             timeout = max(300, int(file_size / (1024 * 1024)) * 10)
             timeout = min(timeout, 3600)
 
-            for attempt in range(3):
-                print(f"업로드 시도 {attempt + 1}/3")
-
-                try:
-                    with open(file_path, 'rb') as f:
-                        response = self._make_request(
-                            'PUT',
-                            f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}/{object_name}",
-                            data=f,
-                            headers={'Content-Type': 'application/octet-stream'},
-                            timeout=timeout
-                        )
-
-                        if response.status_code in [200, 201]:
-                            print(f"파일 업로드 성공: {object_name}")
-                            if progress_callback:
-                                progress_callback(100)
-                            return True
-                        else:
-                            print(f"업로드 실패 (시도 {attempt + 1}): 상태 코드 {response.status_code}")
-                            print(f"응답: {response.text}")
-
-                except (requests.exceptions.SSLError, requests.exceptions.ConnectionError,
-                        requests.exceptions.Timeout, requests.exceptions.ReadTimeout) as e:
-                    print(f"네트워크 오류 (시도 {attempt + 1}): {str(e)}")
-                    if attempt < 2:
-                        time.sleep(2 ** attempt)
-                    else:
-                        print(f"최대 재시도 횟수 초과")
-                        return False
+            with open(file_path, 'rb') as f:
+                response = self._make_request(
+                    'PUT',
+                    f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}/{object_name}",
+                    data=f,
+                    headers={'Content-Type': 'application/octet-stream'},
+                    timeout=timeout
+                )
 
-                except Exception as e:
-                    print(f"예상치 못한 오류 (시도 {attempt + 1}): {str(e)}")
-                    if attempt < 2:
-                        time.sleep(2 ** attempt)
-                    else:
-                        return False
+            if response.status_code in [200, 201]:
+                print(f"파일 업로드 성공: {object_name}")
+                if progress_callback:
+                    progress_callback(100)
+                return True
 
+            print(f"업로드 실패: 상태 코드 {response.status_code}")
+            print(f"응답: {response.text}")
             return False
 
         except Exception as e:
             print(f"소용량 파일 업로드 오류: {str(e)}")
             return False
 
-    def upload_large_file_slo(self, container_name, object_name, file_path, progress_callback=None):
+    def upload_large_file_slo(self, container_name, object_name, file_path, progress_callback=None, max_workers=None, resume=None,
+                              dedup=None):
 
         try:
             file_size = os.path.getsize(file_path)
-            segment_size = 100 * 1024 * 1024
-
-            if segment_size > file_size:
-                segment_size = max(file_size // 10, 5 * 1024 * 1024)
+            segment_size = self.choose_segment_size(file_size)
+            dedup = self.dedup_segments if dedup is None else dedup
 
             total_segments = (file_size + segment_size - 1) // segment_size
-            print(f"SLO 업로드: {total_segments}개 세그먼트, 세그먼트 크기: {self.format_file_size(segment_size)}")
+            if total_segments > self.max_manifest_segments ** 2:
+                print(f"SLO 업로드 불가: 세그먼트 {total_segments}개가 중첩 매니페스트 한도를 초과합니다")
+                return False
+
+            workers = max(1, min(max_workers or self.segment_workers, total_segments))
+            print(f"SLO 업로드: {total_segments}개 세그먼트, 세그먼트 크기: {self.format_file_size(segment_size)}, 동시 업로드: {workers}")
 
             segment_container = f"{container_name}_segments"
             try:
@@ -232,70 +510,84 @@ class NaverArchiveStorageClient:
             except:
                 pass
 
-            uploaded_bytes = 0
-            segments_manifest = []
-
-            with open(file_path, 'rb') as f:
-                for segment_num in range(total_segments):
-                    start_byte = segment_num * segment_size
-                    end_byte = min(start_byte + segment_size, file_size)
-                    segment_data = f.read(end_byte - start_byte)
-
-                    if not segment_data:
-                        break
-
-                    segment_object_name = f"{object_name}/{segment_num:06d}"
-
-                    segment_uploaded = False
-                    for attempt in range(3):
-                        try:
-                            print(f"세그먼트 {segment_num + 1}/{total_segments} 업로드 중... (시도 {attempt + 1}/3)")
-
-                            response = self._make_request(
-                                'PUT',
-                                f"{self.storage_url}/v1/AUTH_{self.project_id}/{segment_container}/{segment_object_name}",
-                                data=segment_data,
-                                headers={
-                                    'Content-Type': 'application/octet-stream',
-                                    'Content-Length': str(len(segment_data))
-                                },
-                                timeout=600
-                            )
-
-                            if response.status_code in [200, 201]:
-                                uploaded_bytes += len(segment_data)
-                                segment_uploaded = True
-
-                                segments_manifest.append({
-                                    "path": f"/{segment_container}/{segment_object_name}",
-                                    "etag": response.headers.get('etag', '').strip('"'),
-                                    "size_bytes": len(segment_data)
-                                })
-
-                                if progress_callback:
-                                    progress = int((uploaded_bytes / file_size) * 100)
-                                    progress_callback(progress)
+            progress = TransferProgress(file_size, progress_callback)
+            segments_manifest = [None] * total_segments
+            stop_event = threading.Event()
+
+            journal = None
+            if self.resume_uploads if resume is None else resume:
+                journal = TransferJournal(self.journal_dir, 'slo', {
+                    'file_path': os.path.abspath(file_path),
+                    'file_size': file_size,
+                    'file_mtime_ns': os.stat(file_path).st_mtime_ns,
+                    'storage_url': self.storage_url,
+                    'project_id': self.project_id,
+                    'container': container_name,
+                    'object': object_name,
+                    'segment_size': segment_size,
+                    'dedup': dedup
+                })
+                verified = self._verify_uploaded_segments(journal.load(), workers)
+                for segment_num, entry in verified.items():
+                    if 0 <= segment_num < total_segments:
+                        segments_manifest[segment_num] = entry
+                        progress.add(entry['size_bytes'])
+                journal.start(verified)
+                if verified:
+                    print(f"이어 올리기: {len(verified)}/{total_segments}개 세그먼트가 이미 업로드되어 있습니다")
+
+            pending_segments = [n for n in range(total_segments) if segments_manifest[n] is None]
+            reused_segments = []
+
+            def upload_segment(segment_num):
+                if stop_event.is_set():
+                    return None
+
+                start_byte = segment_num * segment_size
+                length = min(segment_size, file_size - start_byte)
+                segment_object_name = f"{object_name}/{segment_num:06d}"
+
+                if dedup:
+                    entry, reused = self._upload_segment_dedup(
+                        segment_container, file_path, start_byte, length, f"{segment_num + 1}/{total_segments}"
+                    )
+                    if reused:
+                        reused_segments.append(length)
+                else:
+                    entry = self._upload_segment(
+                        segment_container, segment_object_name, file_path, start_byte, length,
+                        f"{segment_num + 1}/{total_segments}"
+                    )
+                segments_manifest[segment_num] = entry
+                if journal:
+                    journal.record(segment_num, entry)
+                progress.add(length)
+                return entry
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(upload_segment, segment_num) for segment_num in pending_segments]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except Exception:
+                    stop_event.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
 
-                                print(f"세그먼트 {segment_num + 1}/{total_segments} 업로드 완료")
-                                break
-                            else:
-                                print(f"세그먼트 업로드 실패 (시도 {attempt + 1}): {response.status_code}")
-                                print(f"응답: {response.text}")
-                                if attempt == 2:
-                                    raise Exception(f"세그먼트 {segment_num + 1} 업로드 최종 실패")
+            if dedup:
+                print(f"중복 제거: {len(reused_segments)}/{len(pending_segments)}개 세그먼트 재사용 ({self.format_file_size(sum(reused_segments))} 전송 생략)")
 
-                        except Exception as e:
-                            print(f"세그먼트 {segment_num + 1} 업로드 오류 (시도 {attempt + 1}): {str(e)}")
-                            if attempt < 2:
-                                time.sleep(2 ** attempt)
-                            else:
-                                raise
+            print("모든 세그먼트 업로드 완료. SLO 매니페스트 생성 중...")
+            if total_segments > self.max_manifest_segments:
+                segments_manifest = self._create_sub_manifests(segment_container, object_name, segments_manifest)
 
-                    if not segment_uploaded:
-                        raise Exception(f"세그먼트 {segment_num + 1} 업로드 실패")
+            if not self.create_slo_manifest(container_name, object_name, segments_manifest):
+                return False
 
-            print("모든 세그먼트 업로드 완료. SLO 매니페스트 생성 중...")
-            return self.create_slo_manifest(container_name, object_name, segments_manifest)
+            if journal:
+                journal.remove()
+            return True
 
         except Exception as e:
             print(f"SLO 업로드 오류: {str(e)}")
@@ -303,23 +595,117 @@ class NaverArchiveStorageClient:
             traceback.print_exc()
             return False
 
-    def create_slo_manifest(self, container_name, object_name, segments_manifest):
+    def choose_segment_size(self, file_size):
 
-        try:
+        if file_size < self.segment_size:
+            return max(file_size // 10, 5 * 1024 * 1024)
+
+        mib = 1024 * 1024
+        segment_size = -(-file_size // self.max_manifest_segments)
+        segment_size = -(-segment_size // mib) * mib
+        return max(self.segment_size, min(segment_size, self.max_auto_segment_size))
+
+    def _create_sub_manifests(self, segment_container, object_name, segments_manifest):
+
+        groups = [segments_manifest[i:i + self.max_manifest_segments]
+                  for i in range(0, len(segments_manifest), self.max_manifest_segments)]
+        print(f"중첩 SLO: {len(groups)}개 하위 매니페스트 생성 중...")
+
+        def put_group(index):
+            sub_manifest_name = f"{object_name}/manifest/{index:06d}"
+            response = self._put_slo_manifest(segment_container, sub_manifest_name, groups[index])
+            if response.status_code not in [200, 201]:
+                raise TransferStatusError(f"하위 매니페스트 생성 실패 ({sub_manifest_name}): {response.status_code}",
+                                          response.status_code, response.headers)
+            return {
+                'path': f"/{segment_container}/{sub_manifest_name}",
+                'etag': response.headers.get('etag', '').strip('"') or None,
+                'size_bytes': sum(entry['size_bytes'] for entry in groups[index])
+            }
+
+        with ThreadPoolExecutor(max_workers=self.request_workers) as executor:
+            return list(executor.map(put_group, range(len(groups))))
 
-            manifest_json = json.dumps(segments_manifest)
+    def _verify_uploaded_segments(self, journal_entries, workers):
 
+        def verify(item):
+            segment_num, entry = item
+            try:
+                response = self._make_request('HEAD', f"{self.storage_url}/v1/AUTH_{self.project_id}{entry['path']}", timeout=60)
+                if response.status_code != 200:
+                    return None
+                if int(response.headers.get('content-length', -1)) != entry['size_bytes']:
+                    return None
+                if response.headers.get('etag', '').strip('"') != entry['etag']:
+                    return None
+                return segment_num, entry
+            except Exception as e:
+                print(f"세그먼트 확인 오류 ({entry['path']}): {str(e)}")
+                return None
+
+        if not journal_entries:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(verify, journal_entries.items())
+            return dict(result for result in results if result)
+
+    def _upload_segment(self, segment_container, segment_object_name, file_path, start_byte, length, segment_label):
+
+        print(f"세그먼트 {segment_label} 업로드 중...")
+
+        with FilePartReader(file_path, start_byte, length, self.transfer_budget) as segment_data:
             response = self._make_request(
                 'PUT',
-                f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}/{object_name}?multipart-manifest=put",
-                data=manifest_json.encode('utf-8'),
+                f"{self.storage_url}/v1/AUTH_{self.project_id}/{segment_container}/{segment_object_name}",
+                data=segment_data,
                 headers={
-                    'Content-Type': 'application/json',
-                    'Content-Length': str(len(manifest_json.encode('utf-8')))
+                    'Content-Type': 'application/octet-stream',
+                    'Content-Length': str(length)
                 },
-                timeout=300
+                timeout=600
             )
 
+        if response.status_code not in [200, 201]:
+            print(f"응답: {response.text}")
+            raise Exception(f"세그먼트 {segment_label} 업로드 실패: {response.status_code}")
+
+        print(f"세그먼트 {segment_label} 업로드 완료")
+        return {
+            "path": f"/{segment_container}/{segment_object_name}",
+            "etag": response.headers.get('etag', '').strip('"'),
+            "size_bytes": length
+        }
+
+    def _upload_segment_dedup(self, segment_container, file_path, start_byte, length, segment_label):
+
+        digest = hashlib.sha256()
+        with FilePartReader(file_path, start_byte, length) as reader:
+            for block in iter(lambda: reader.read(8 * 1024 * 1024), b''):
+                digest.update(block)
+
+        segment_object_name = f"{self.dedup_prefix}/{digest.hexdigest()}"
+        response = self._make_request(
+            'HEAD',
+            f"{self.storage_url}/v1/AUTH_{self.project_id}/{segment_container}/{segment_object_name}",
+            timeout=60
+        )
+
+        if response.status_code == 200 and int(response.headers.get('content-length', -1)) == length:
+            print(f"세그먼트 {segment_label} 중복: 기존 세그먼트 재사용")
+            return {
+                "path": f"/{segment_container}/{segment_object_name}",
+                "etag": response.headers.get('etag', '').strip('"'),
+                "size_bytes": length
+            }, True
+
+        return self._upload_segment(segment_container, segment_object_name, file_path, start_byte, length, segment_label), False
+
+    def create_slo_manifest(self, container_name, object_name, segments_manifest):
+
+        try:
+            response = self._put_slo_manifest(container_name, object_name, segments_manifest)
+
             if response.status_code in [200, 201]:
                 print(f"SLO 매니페스트 생성 성공: {object_name}")
                 print("대용량 파일 SLO 업로드 완료!")
@@ -332,13 +718,40 @@ class NaverArchiveStorageClient:
             print(f"SLO 매니페스트 생성 오류: {str(e)}")
             return False
 
+    def _put_slo_manifest(self, container_name, object_name, segments_manifest):
+
+        manifest_json = json.dumps(segments_manifest)
+
+        return self._make_request(
+            'PUT',
+            f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}/{object_name}?multipart-manifest=put",
+            data=manifest_json.encode('utf-8'),
+            headers={
+                'Content-Type': 'application/json',
+                'Content-Length': str(len(manifest_json.encode('utf-8')))
+            },
+            timeout=300
+        )
+
     def delete_slo_object(self, container_name, object_name):
 
         try:
+            object_url = f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}/{object_name}"
+
+            segments, sub_manifests = self.expand_slo_manifest(container_name, object_name)
+            shared_prefix = f"/{container_name}_segments/{self.dedup_prefix}/"
+            if any(entry['path'].startswith(shared_prefix) for entry in segments):
+                print(f"공유 세그먼트를 사용하는 SLO: 매니페스트만 삭제 ({object_name})")
+                if not self.delete_object(container_name, object_name):
+                    return False
+                for path in sub_manifests:
+                    sub_container, sub_object = path.lstrip('/').split('/', 1)
+                    self.delete_object(sub_container, sub_object)
+                return True
 
             response = self._make_request(
                 'DELETE',
-                f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}/{object_name}?multipart-manifest=delete"
+                f"{object_url}?multipart-manifest=delete"
             )
 
             if response.status_code == 204:
@@ -352,6 +765,145 @@ class NaverArchiveStorageClient:
             print(f"SLO 객체 삭제 오류: {str(e)}")
             return False
 
+    def get_slo_manifest(self, container_name, object_name, raw=True):
+
+        response = self._make_request(
+            'GET',
+            f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}/{object_name}",
+            params={'multipart-manifest': 'get', 'format': 'raw'} if raw else {'multipart-manifest': 'get'},
+            timeout=300
+        )
+
+        if response.status_code != 200:
+            raise TransferStatusError(f"SLO 매니페스트 조회 실패: {response.status_code}", response.status_code, response.headers)
+
+        manifest = []
+        for entry in response.json():
+            manifest.append({
+                'path': entry.get('path') or entry.get('name'),
+                'etag': entry.get('etag') or entry.get('hash'),
+                'size_bytes': entry['size_bytes'] if 'size_bytes' in entry else entry.get('bytes'),
+                'range': entry.get('range'),
+                'sub_slo': entry.get('sub_slo', False)
+            })
+        return manifest
+
+    def expand_slo_manifest(self, container_name, object_name):
+
+        segments = []
+        sub_manifests = []
+
+        for entry in self.get_slo_manifest(container_name, object_name, raw=False):
+            path = unquote(entry['path'])
+            if entry['sub_slo'] and not entry['range']:
+                sub_container, sub_object = path.lstrip('/').split('/', 1)
+                sub_segments, nested = self.expand_slo_manifest(sub_container, sub_object)
+                segments.extend(sub_segments)
+                sub_manifests.append(path)
+                sub_manifests.extend(nested)
+            else:
+                entry['path'] = path
+                segments.append(entry)
+
+        return segments, sub_manifests
+
+    def collect_orphan_segments(self, container_name, grace_period=24 * 60 * 60, dry_run=True, max_workers=None):
+
+        segment_container = f"{container_name}_segments"
+        workers = max_workers or self.request_workers
+        report = {
+            'manifests': 0,
+            'referenced': 0,
+            'scanned': 0,
+            'skipped_recent': 0,
+            'orphans': [],
+            'orphan_bytes': 0,
+            'deleted': 0,
+            'errors': []
+        }
+
+        try:
+            print(f"고아 세그먼트 정리 시작: {segment_container} (유예 기간 {grace_period}초, {'점검만' if dry_run else '삭제'})")
+
+            records = list(self.iter_objects_with_prefix(container_name, delimiter=None))
+
+            # slo_etag는 해당 기능 이후에 생성된 매니페스트에만 붙으므로, 없는 오브젝트는 각각 HEAD로 확인
+            manifests = [record['name'] for record in records if 'slo_etag' in record]
+            unknown = [record['name'] for record in records if 'slo_etag' not in record]
+            del records
+
+            def is_manifest(name):
+                response = self._make_request('HEAD', f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}/{name}", timeout=60)
+                if response.status_code not in [200, 404]:
+                    raise TransferStatusError(f"오브젝트 확인 실패 ({name}): {response.status_code}", response.status_code)
+                return response.headers.get('x-static-large-object', '').lower() == 'true'
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                flags = list(executor.map(is_manifest, unknown))
+            manifests.extend(name for name, flag in zip(unknown, flags) if flag)
+
+            report['manifests'] = len(manifests)
+            referenced = set()
+            segment_prefix = f"/{segment_container}/"
+            pending = [(container_name, name) for name in manifests]
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                while pending:
+                    manifests_batch = list(executor.map(lambda item: self.get_slo_manifest(item[0], item[1], raw=False), pending))
+                    pending = []
+                    for manifest in manifests_batch:
+                        for entry in manifest:
+                            path = unquote(entry['path'])
+                            if not path.startswith(segment_prefix):
+                                continue
+                            segment_name = path[len(segment_prefix):]
+                            if segment_name in referenced:
+                                continue
+                            referenced.add(segment_name)
+                            if entry['sub_slo']:
+                                pending.append((segment_container, segment_name))
+
+            report['referenced'] = len(referenced)
+            cutoff = time.time() - grace_period
+
+            for record in self.iter_objects_with_prefix(segment_container, delimiter=None):
+                report['scanned'] += 1
+                if record['name'] in referenced:
+                    continue
+                if self._parse_listing_time(record.get('last_modified')) > cutoff:
+                    report['skipped_recent'] += 1
+                    continue
+                report['orphans'].append(record['name'])
+                report['orphan_bytes'] += record.get('bytes', 0)
+
+            print(f"매니페스트 {report['manifests']}개, 참조 세그먼트 {report['referenced']}개, "
+                  f"세그먼트 {report['scanned']}개 검사, 고아 세그먼트 {len(report['orphans'])}개 "
+                  f"({self.format_file_size(report['orphan_bytes'])}), 유예 기간 내 {report['skipped_recent']}개")
+
+            if not dry_run and report['orphans']:
+                result = self.bulk_delete(segment_container, report['orphans'])
+                report['deleted'] = result['deleted']
+                report['errors'] = result['errors']
+
+            return report
+
+        except Exception as e:
+            print(f"고아 세그먼트 정리 오류: {str(e)}")
+            report['errors'].append(('', str(e)))
+            report['orphans'] = []
+            return report
+
+    @staticmethod
+    def _parse_listing_time(value):
+
+        if not value:
+            return time.time()
+
+        try:
+            return datetime.strptime(value[:19], '%Y-%m-%dT%H:%M:%S').replace(tzinfo=timezone.utc).timestamp()
+        except ValueError:
+            return time.time()
+
     def create_container(self, container_name):
 
         try:
@@ -384,6 +936,152 @@ class NaverArchiveStorageClient:
             print(f"오브젝트 삭제 오류: {str(e)}")
             return False
 
+    def bulk_delete(self, container_name, object_names, progress_callback=None):
+
+        result = {'deleted': 0, 'not_found': 0, 'errors': []}
+        batch = []
+
+        def flush():
+            body = '\n'.join(quote(f"/{container_name}/{name}") for name in batch).encode('utf-8')
+            try:
+                response = self._make_request(
+                    'POST',
+                    f"{self.storage_url}/v1/AUTH_{self.project_id}?bulk-delete",
+                    data=body,
+                    headers={
+                        'Content-Type': 'text/plain',
+                        'Accept': 'application/json'
+                    },
+                    timeout=600
+                )
+
+                if response.status_code != 200:
+                    raise Exception(f"상태 코드 {response.status_code} - {response.text}")
+
+                report = response.json()
+                result['deleted'] += report.get('Number Deleted', 0)
+                result['not_found'] += report.get('Number Not Found', 0)
+                result['errors'].extend((unquote(path), status) for path, status in report.get('Errors', []))
+
+                response_status = report.get('Response Status', '200 OK')
+                if not response_status.startswith('2') and not report.get('Errors'):
+                    result['errors'].extend((f"/{container_name}/{name}", response_status) for name in batch)
+
+            except Exception as e:
+                print(f"일괄 삭제 요청 오류: {str(e)}")
+                result['errors'].extend((f"/{container_name}/{name}", str(e)) for name in batch)
+
+            print(f"일괄 삭제 진행: {result['deleted']}개 삭제, 실패 {len(result['errors'])}개")
+            if progress_callback:
+                progress_callback(result['deleted'] + result['not_found'] + len(result['errors']))
+            batch.clear()
+
+        for name in object_names:
+            batch.append(name)
+            if len(batch) >= self.bulk_delete_batch_size:
+                flush()
+
+        if batch:
+            flush()
+
+        for path, status in result['errors']:
+            print(f"  - 삭제 실패: {path} ({status})")
+
+        return result
+
+    def delete_objects(self, container_name, object_names, progress_callback=None):
+
+        manifests, plain_objects, failures = self._classify_manifests(container_name, object_names)
+
+        result = self.bulk_delete(container_name, plain_objects, progress_callback)
+        result['errors'].extend(failures)
+        self._delete_slo_objects(container_name, manifests, result)
+        return result
+
+    def _classify_manifests(self, container_name, object_names):
+
+        def is_manifest(name):
+            try:
+                response = self._make_request('HEAD', f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}/{name}", timeout=60)
+                if response.status_code == 404:
+                    return False
+                if response.status_code != 200:
+                    return f"오브젝트 확인 실패: {response.status_code}"
+                return response.headers.get('x-static-large-object', '').lower() == 'true'
+            except Exception as e:
+                return f"오브젝트 확인 오류: {str(e)}"
+
+        object_names = list(object_names)
+        with ThreadPoolExecutor(max_workers=self.request_workers) as executor:
+            manifest_flags = list(executor.map(is_manifest, object_names))
+
+        # SLO 여부를 확인하지 못한 오브젝트는 세그먼트가 남지 않도록 삭제하지 않고 오류로 보고
+        manifests = [name for name, flag in zip(object_names, manifest_flags) if flag is True]
+        plain_objects = [name for name, flag in zip(object_names, manifest_flags) if flag is False]
+        failures = [(f"/{container_name}/{name}", flag) for name, flag in zip(object_names, manifest_flags)
+                    if isinstance(flag, str)]
+        return manifests, plain_objects, failures
+
+    def delete_folder(self, container_name, folder_prefix):
+
+        try:
+            if not folder_prefix.endswith('/'):
+                folder_prefix += '/'
+
+            segmented_objects = set()
+            try:
+                for record in self.iter_objects_with_prefix(f"{container_name}_segments", folder_prefix, delimiter=None):
+                    segmented_objects.add(record['name'].rsplit('/', 1)[0])
+            except Exception as e:
+                print(f"세그먼트 컨테이너 조회 실패, 오브젝트별로 SLO 여부를 확인합니다: {str(e)}")
+                segmented_objects = None
+
+            manifests = []
+            unchecked = []
+
+            def plain_object_names():
+                for record in self.iter_objects_with_prefix(container_name, folder_prefix, delimiter=None):
+                    if 'slo_etag' in record or (segmented_objects is not None and record['name'] in segmented_objects):
+                        manifests.append(record['name'])
+                    elif segmented_objects is None:
+                        unchecked.append(record['name'])
+                    else:
+                        yield record['name']
+
+            result = self.bulk_delete(container_name, plain_object_names())
+
+            if unchecked:
+                checked_manifests, plain_objects, failures = self._classify_manifests(container_name, unchecked)
+                manifests.extend(checked_manifests)
+                checked_result = self.bulk_delete(container_name, plain_objects)
+                result['deleted'] += checked_result['deleted']
+                result['not_found'] += checked_result['not_found']
+                result['errors'].extend(checked_result['errors'])
+                result['errors'].extend(failures)
+
+            self._delete_slo_objects(container_name, manifests, result)
+
+            print(f"폴더 삭제 완료: {folder_prefix} ({result['deleted']}개 객체, 실패 {len(result['errors'])}개)")
+            return not result['errors']
+
+        except Exception as e:
+            print(f"폴더 삭제 오류: {str(e)}")
+            return False
+
+    def _delete_slo_objects(self, container_name, manifests, result):
+
+        if not manifests:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.request_workers) as executor:
+            outcomes = list(executor.map(lambda name: self.delete_slo_object(container_name, name), manifests))
+
+        for name, success in zip(manifests, outcomes):
+            if success:
+                result['deleted'] += 1
+            else:
+                result['errors'].append((f"/{container_name}/{name}", 'SLO 삭제 실패'))
+
     def get_containers(self):
 
         try:
@@ -456,13 +1154,67 @@ class NaverArchiveStorageClient:
     def download_file(self, container_name, object_name, save_path, progress_callback=None):
 
         try:
-            response = self._make_request('GET', f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}/{object_name}", stream=True)
+            object_url = f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}/{object_name}"
+            part_path = f"{save_path}.part"
+            state = self._load_download_state(part_path)
+
+            if state and state.get('mode') == 'parallel':
+                return self.download_file_parallel(container_name, object_name, save_path, progress_callback)
+            if state and state.get('mode') == 'slo':
+                return self.download_slo_parallel(container_name, object_name, save_path, progress_callback)
+
+            offset = os.path.getsize(part_path) if state else 0
+            headers = {}
+            if offset > 0:
+                headers['Range'] = f"bytes={offset}-"
+                headers['If-Match'] = state['etag']
+
+            response = self._make_request('GET', object_url, headers=headers, stream=True)
+
+            if offset > 0 and response.status_code == 416 and offset == state['size']:
+                response.close()
+                return self._finish_download(part_path, save_path, state, object_name)
+
+            if offset > 0 and (response.status_code != 206 or
+                               response.headers.get('last-modified') != state['last_modified']):
+                print("원격 오브젝트가 변경되었거나 이어받기를 지원하지 않음: 처음부터 다시 다운로드")
+                response.close()
+                offset = 0
+                response = self._make_request('GET', object_url, stream=True)
+
+            if response.status_code in [200, 206]:
+                if offset > 0:
+                    total_size = state['size']
+                else:
+                    total_size = int(response.headers.get('content-length', 0))
 
-            if response.status_code == 200:
-                total_size = int(response.headers.get('content-length', 0))
-                downloaded = 0
+                    if total_size >= self.parallel_download_threshold and response.headers.get('x-static-large-object', '').lower() == 'true':
+                        response.close()
+                        return self.download_slo_parallel(
+                            container_name, object_name, save_path, progress_callback,
+                            object_headers=response.headers
+                        )
+
+                    if total_size >= self.parallel_download_threshold and response.headers.get('accept-ranges') == 'bytes':
+                        response.close()
+                        return self.download_file_parallel(
+                            container_name, object_name, save_path, progress_callback,
+                            object_headers=response.headers
+                        )
+
+                    state = {
+                        'mode': 'serial',
+                        'etag': response.headers.get('etag', ''),
+                        'last_modified': response.headers.get('last-modified', ''),
+                        'size': total_size
+                    }
+                    self._save_download_state(part_path, state)
 
-                with open(save_path, 'wb') as f:
+                if offset > 0:
+                    print(f"이어받기: {self.format_file_size(offset)}부터 다운로드")
+                downloaded = offset
+
+                with open(part_path, 'ab' if offset > 0 else 'wb') as f:
                     for chunk in response.iter_content(chunk_size=8192):
                         if chunk:
                             f.write(chunk)
@@ -471,8 +1223,7 @@ class NaverArchiveStorageClient:
                                 progress = int((downloaded / total_size) * 100)
                                 progress_callback(progress)
 
-                print(f"파일 다운로드 성공: {object_name}")
-                return True
+                return self._finish_download(part_path, save_path, state, object_name)
             else:
                 print(f"파일 다운로드 실패: {response.status_code}")
                 return False
@@ -481,42 +1232,340 @@ class NaverArchiveStorageClient:
             print(f"파일 다운로드 오류: {str(e)}")
             return False
 
-    def get_objects_with_prefix(self, container_name, prefix=""):
+    def download_file_parallel(self, container_name, object_name, save_path, progress_callback=None,
+                               max_workers=None, object_headers=None):
 
         try:
-            url_params = "?format=json&delimiter=/"
-            if prefix:
-                url_params += f"&prefix={prefix}"
+            object_url = f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}/{object_name}"
+            part_path = f"{save_path}.part"
 
-            url = f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}{url_params}"
-            print(f"폴더별 오브젝트 목록 조회 URL: {url}")
-            print(f"컨테이너명: {container_name}, Prefix: {prefix}")
+            if object_headers is None:
+                response = self._make_request('HEAD', object_url, timeout=60)
+                if response.status_code != 200:
+                    print(f"파일 다운로드 실패: {response.status_code}")
+                    return False
+                object_headers = response.headers
+
+            total_size = int(object_headers.get('content-length', 0))
+            etag = object_headers.get('etag', '')
+            is_slo = object_headers.get('x-static-large-object', '').lower() == 'true'
+
+            chunk_size = self.download_chunk_size
+            state = {
+                'mode': 'parallel',
+                'etag': etag,
+                'last_modified': object_headers.get('last-modified', ''),
+                'size': total_size,
+                'chunk_size': chunk_size,
+                'completed': []
+            }
 
-            response = self._make_request('GET', url)
-            print(f"응답 상태 코드: {response.status_code}")
+            ranges = [(offset, min(chunk_size, total_size - offset)) for offset in range(0, total_size, chunk_size)]
+            print(f"병렬 다운로드: {len(ranges)}개 구간, 구간 크기: {self.format_file_size(chunk_size)}")
 
-            if response.status_code == 200:
-                try:
-                    objects = response.json()
-                    print(f"파싱된 오브젝트 목록: {objects}")
-                    print(f"오브젝트 개수: {len(objects)}")
-                    return objects
-                except json.JSONDecodeError as e:
-                    print(f"JSON 파싱 오류: {e}")
-                    return []
-            elif response.status_code == 204:
-                print("빈 컨테이너/폴더 (204 No Content)")
-                return []
-            else:
-                print(f"오브젝트 목록 조회 실패: {response.status_code}")
-                print(f"응답 내용: {response.text}")
-                return []
+            def download_range(index, progress):
+                offset, length = ranges[index]
+                self._download_range(object_url, part_path, offset, length, etag, progress, f"{index + 1}/{len(ranges)}")
+
+            self._download_parts(part_path, state, [length for offset, length in ranges], download_range,
+                                 progress_callback, max_workers)
+
+            if not self._verify_download(part_path, total_size, etag, is_slo):
+                self._remove_download_state(part_path)
+                return False
+
+            return self._finish_download(part_path, save_path, state, object_name)
+
+        except Exception as e:
+            print(f"병렬 다운로드 오류: {str(e)}")
+            return False
+
+    def download_slo_parallel(self, container_name, object_name, save_path, progress_callback=None,
+                              max_workers=None, object_headers=None):
+
+        try:
+            object_url = f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}/{object_name}"
+            part_path = f"{save_path}.part"
+
+            if object_headers is None:
+                response = self._make_request('HEAD', object_url, timeout=60)
+                if response.status_code != 200:
+                    print(f"파일 다운로드 실패: {response.status_code}")
+                    return False
+                object_headers = response.headers
+
+            manifest, sub_manifests = self.expand_slo_manifest(container_name, object_name)
+
+            segments = []
+            offset = 0
+            for entry in manifest:
+                length = entry['size_bytes']
+                if entry.get('range'):
+                    start, end = entry['range'].split('-')
+                    length = int(end) - int(start) + 1
+                segments.append((offset, length, entry))
+                offset += length
+
+            total_size = offset
+            expected_size = int(object_headers.get('content-length', total_size))
+            if expected_size != total_size:
+                print(f"SLO 매니페스트 크기 불일치: {total_size}/{expected_size} bytes")
+                return False
+
+            state = {
+                'mode': 'slo',
+                'etag': object_headers.get('etag', ''),
+                'last_modified': object_headers.get('last-modified', ''),
+                'size': total_size,
+                'segments': len(segments),
+                'completed': []
+            }
+            print(f"SLO 병렬 다운로드: {len(segments)}개 세그먼트, 총 {self.format_file_size(total_size)}")
+
+            def download_segment(index, progress):
+                offset, length, entry = segments[index]
+                self._download_segment(part_path, offset, length, entry, progress, f"{index + 1}/{len(segments)}")
+
+            self._download_parts(part_path, state, [length for offset, length, entry in segments], download_segment,
+                                 progress_callback, max_workers)
+
+            return self._finish_download(part_path, save_path, state, object_name)
+
+        except Exception as e:
+            print(f"SLO 병렬 다운로드 오류: {str(e)}")
+            return False
+
+    def _download_parts(self, part_path, state, part_sizes, download_part, progress_callback, max_workers):
+
+        saved_state = self._load_download_state(part_path)
+        if (saved_state and os.path.getsize(part_path) == state['size'] and
+                all(saved_state.get(key) == value for key, value in state.items() if key != 'completed')):
+            state['completed'] = saved_state.get('completed', [])
+            print(f"이어받기: {len(state['completed'])}개 구간이 이미 다운로드되어 있습니다")
+        else:
+            with open(part_path, 'wb') as f:
+                f.truncate(state['size'])
+        self._save_download_state(part_path, state)
+
+        completed = set(state['completed'])
+        pending = [index for index in range(len(part_sizes)) if index not in completed]
+        workers = max(1, min(max_workers or self.download_workers, len(pending)))
+        print(f"동시 다운로드: {workers}")
+
+        progress = TransferProgress(state['size'], progress_callback, report_interval=5)
+        progress.add(sum(part_sizes[index] for index in completed if index < len(part_sizes)))
+        state_lock = threading.Lock()
+        stop_event = threading.Event()
+
+        def run(index):
+            if stop_event.is_set():
+                return
+            download_part(index, progress)
+            with state_lock:
+                state['completed'].append(index)
+                self._save_download_state(part_path, state)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run, index) for index in pending]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except Exception:
+                stop_event.set()
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _download_range(self, object_url, save_path, offset, length, etag, progress, range_label):
+
+        written = [0]
+
+        def fetch_remaining():
+            headers = {'Range': f"bytes={offset + written[0]}-{offset + length - 1}"}
+            if etag:
+                headers['If-Match'] = etag
+
+            response = self._make_request('GET', object_url, retry=False, headers=headers, stream=True, timeout=600)
+            if response.status_code != 206:
+                response.close()
+                raise TransferStatusError(f"구간 다운로드 실패: 상태 코드 {response.status_code}",
+                                          response.status_code, response.headers)
+
+            with open(save_path, 'r+b') as f:
+                f.seek(offset + written[0])
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    if not chunk:
+                        continue
+                    chunk = chunk[:length - written[0]]
+                    f.write(chunk)
+                    written[0] += len(chunk)
+                    progress.add(len(chunk))
+
+            if written[0] != length:
+                raise requests.exceptions.ConnectionError(f"구간 크기 불일치: {written[0]}/{length} bytes")
+
+        self.retry_policy.call(fetch_remaining, f"구간 {range_label} 다운로드")
+
+    def _download_segment(self, part_path, offset, length, entry, progress, segment_label):
+
+        segment_url = f"{self.storage_url}/v1/AUTH_{self.project_id}{quote(entry['path'])}"
+        headers = {}
+        if entry.get('range'):
+            headers['Range'] = f"bytes={entry['range']}"
+
+        written = [0]
+
+        def fetch_segment():
+            progress.add(-written[0])
+            written[0] = 0
+
+            response = self._make_request('GET', segment_url, retry=False, headers=headers, stream=True, timeout=600)
+            if response.status_code not in [200, 206]:
+                response.close()
+                raise TransferStatusError(f"세그먼트 다운로드 실패: 상태 코드 {response.status_code}",
+                                          response.status_code, response.headers)
+
+            verify_md5 = not entry.get('range') and response.headers.get('x-static-large-object', '').lower() != 'true'
+            md5 = hashlib.md5()
+
+            with open(part_path, 'r+b') as f:
+                f.seek(offset)
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    if not chunk:
+                        continue
+                    chunk = chunk[:length - written[0]]
+                    f.write(chunk)
+                    if verify_md5:
+                        md5.update(chunk)
+                    written[0] += len(chunk)
+                    progress.add(len(chunk))
+
+            if written[0] != length:
+                raise requests.exceptions.ConnectionError(f"세그먼트 크기 불일치: {written[0]}/{length} bytes")
+
+            if verify_md5 and entry.get('etag') and md5.hexdigest() != entry['etag'].strip('"'):
+                raise requests.exceptions.ConnectionError(f"세그먼트 ETag 불일치: {entry['path']}")
+
+        self.retry_policy.call(fetch_segment, f"세그먼트 {segment_label} 다운로드")
+
+    def _verify_download(self, save_path, total_size, etag, is_slo):
+
+        actual_size = os.path.getsize(save_path)
+        if actual_size != total_size:
+            print(f"다운로드 크기 불일치: {actual_size}/{total_size} bytes")
+            return False
+
+        etag = etag.strip('"')
+        if is_slo or len(etag) != 32:
+            return True
+
+        md5 = hashlib.md5()
+        with open(save_path, 'rb') as f:
+            for block in iter(lambda: f.read(8 * 1024 * 1024), b''):
+                md5.update(block)
+
+        if md5.hexdigest() != etag:
+            print(f"다운로드 ETag 불일치: {md5.hexdigest()} != {etag}")
+            return False
+
+        return True
+
+    def _finish_download(self, part_path, save_path, state, object_name):
+
+        actual_size = os.path.getsize(part_path)
+        if actual_size != state['size']:
+            print(f"다운로드 크기 불일치: {actual_size}/{state['size']} bytes")
+            return False
+
+        os.replace(part_path, save_path)
+        self._remove_download_state(part_path)
+        print(f"파일 다운로드 성공: {object_name}")
+        return True
+
+    def _load_download_state(self, part_path):
+
+        state_path = f"{part_path}.json"
+        if not os.path.exists(state_path) or not os.path.exists(part_path):
+            return None
+
+        try:
+            with open(state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"다운로드 상태 읽기 오류: {str(e)}")
+            return None
+
+    def _save_download_state(self, part_path, state):
+
+        state_path = f"{part_path}.json"
+        with open(f"{state_path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(f"{state_path}.tmp", state_path)
+
+    def _remove_download_state(self, part_path):
+
+        for path in [part_path, f"{part_path}.json"]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def get_objects_with_prefix(self, container_name, prefix=""):
+
+        try:
+            print(f"컨테이너명: {container_name}, Prefix: {prefix}")
+            objects = list(self.iter_objects_with_prefix(container_name, prefix))
+            print(f"오브젝트 개수: {len(objects)}")
+            return objects
 
         except Exception as e:
             print(f"오브젝트 목록 조회 오류: {str(e)}")
             return []
 
-    def parse_folder_structure(self, objects, current_prefix=""):
+    def iter_objects_with_prefix(self, container_name, prefix="", delimiter="/", page_size=10000):
+
+        for page in self._iter_listing_pages(container_name, prefix, delimiter, page_size):
+            for record in page:
+                yield record
+
+    def _iter_listing_pages(self, container_name, prefix="", delimiter="/", page_size=10000):
+
+        url = f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}"
+        marker = None
+
+        while True:
+            params = {'format': 'json', 'limit': page_size}
+            if delimiter:
+                params['delimiter'] = delimiter
+            if prefix:
+                params['prefix'] = prefix
+            if marker:
+                params['marker'] = marker
+
+            response = self._make_request('GET', url, params=params, timeout=120)
+
+            if response.status_code == 204:
+                return
+            if response.status_code != 200:
+                raise Exception(f"오브젝트 목록 조회 실패: {response.status_code} - {response.text}")
+
+            try:
+                page = response.json()
+            except json.JSONDecodeError as e:
+                raise Exception(f"JSON 파싱 오류: {e}")
+
+            if not page:
+                return
+
+            yield page
+
+            if len(page) < page_size:
+                return
+
+            last_record = page[-1]
+            marker = last_record.get('name') or last_record.get('subdir')
+
+    def parse_folder_structure(self, objects, current_prefix="", seen_items=None):
 
         try:
             if not objects:
@@ -524,7 +1573,7 @@ class NaverArchiveStorageClient:
 
             folders = []
             files = []
-            seen_items = set()
+            seen_items = set() if seen_items is None else seen_items
 
             for i, obj in enumerate(objects):
                 try:
@@ -582,7 +1631,10 @@ class NaverArchiveStorageClient:
             traceback.print_exc()
             return []
 
-    def upload_folder(self, container_name, local_folder_path, remote_base_path, progress_callback=None):
+    def upload_folder(self, container_name, local_folder_path, remote_base_path, progress_callback=None, use_extract_archive=None):
+
+        if self.use_extract_archive if use_extract_archive is None else use_extract_archive:
+            return self.upload_folder_tar(container_name, local_folder_path, remote_base_path, progress_callback)
 
         try:
             print(f"폴더 업로드 시작: {local_folder_path}")
@@ -596,35 +1648,34 @@ class NaverArchiveStorageClient:
             for root, dirs, files in os.walk(local_folder_path):
                 for file in files:
                     file_path = os.path.join(root, file)
-                    if os.path.isfile(file_path):
-                        all_files.append(file_path)
+                    try:
+                        file_stat = os.stat(file_path)
+                    except OSError:
+                        continue
+                    if stat.S_ISREG(file_stat.st_mode):
+                        all_files.append((file_path, file_stat.st_size))
 
             if not all_files:
                 print("업로드할 파일이 없습니다")
                 return True
 
             total_files = len(all_files)
-            uploaded_files = 0
-            failed_files = []
 
             print(f"업로드할 파일 수: {total_files}")
-            total_size = sum(os.path.getsize(f) for f in all_files)
+            total_size = sum(file_size for file_path, file_size in all_files)
             print(f"총 크기: {self.format_file_size(total_size)}")
 
-            for i, file_path in enumerate(all_files):
-                try:
-                    relative_path = os.path.relpath(file_path, local_folder_path)
+            workers = max(1, min(self.folder_upload_workers, total_files))
+            progress = TransferProgress(total_size, progress_callback, report_interval=5)
 
-                    remote_object_name = f"{remote_base_path}/{relative_path}".replace("\\", "/")
+            def upload_one(index, file_progress_callback):
+                file_path, file_size = all_files[index]
+                relative_path = os.path.relpath(file_path, local_folder_path)
 
-                    print(f"업로드 중 ({i+1}/{total_files}): {relative_path}")
+                try:
+                    remote_object_name = f"{remote_base_path}/{relative_path}".replace("\\", "/")
 
-                    def file_progress_callback(file_progress):
-                        current_file_contribution = file_progress / total_files
-                        completed_files_contribution = (uploaded_files / total_files) * 100
-                        total_progress = int(completed_files_contribution + current_file_contribution)
-                        if progress_callback:
-                            progress_callback(total_progress)
+                    print(f"업로드 중 ({index + 1}/{total_files}): {relative_path}")
 
                     success = self.upload_file(
                         container_name,
@@ -634,21 +1685,26 @@ class NaverArchiveStorageClient:
                     )
 
                     if success:
-                        uploaded_files += 1
                         print(f"업로드 성공: {relative_path}")
                     else:
-                        failed_files.append(relative_path)
                         print(f"업로드 실패: {relative_path}")
+                    return success
 
                 except Exception as e:
                     print(f"파일 업로드 중 오류 ({relative_path}): {str(e)}")
-                    failed_files.append(relative_path)
+                    return False
+
+            results = run_file_transfers(progress, [file_size for file_path, file_size in all_files], upload_one, workers)
+            failed_files = [os.path.relpath(file_path, local_folder_path)
+                            for (file_path, file_size), success in zip(all_files, results) if not success]
 
             if progress_callback:
                 progress_callback(100)
 
+            uploaded_files = total_files - len(failed_files)
             success_rate = (uploaded_files / total_files) * 100
             print(f"폴더 업로드 완료: {uploaded_files}/{total_files} 파일 성공 ({success_rate:.1f}%)")
+            print(progress.status_text())
 
             if failed_files:
                 print(f"실패한 파일들:")
@@ -664,6 +1720,150 @@ class NaverArchiveStorageClient:
             traceback.print_exc()
             return False
 
+    def upload_folder_tar(self, container_name, local_folder_path, remote_base_path, progress_callback=None):
+
+        try:
+            print(f"폴더 일괄 업로드(tar) 시작: {local_folder_path}")
+            print(f"원격 기본 경로: {remote_base_path}")
+
+            if not os.path.exists(local_folder_path):
+                print(f"로컬 폴더가 존재하지 않음: {local_folder_path}")
+                return False
+
+            archive_files = []
+            large_files = []
+            for root, dirs, files in os.walk(local_folder_path):
+                for file in files:
+                    file_path = os.path.join(root, file)
+                    if not os.path.isfile(file_path):
+                        continue
+                    relative_path = os.path.relpath(file_path, local_folder_path).replace(os.sep, '/')
+                    file_size = os.path.getsize(file_path)
+                    if file_size > self.extract_archive_max_file_size:
+                        large_files.append((file_path, relative_path, file_size))
+                    else:
+                        archive_files.append((file_path, relative_path, file_size))
+
+            total_files = len(archive_files) + len(large_files)
+            if total_files == 0:
+                print("업로드할 파일이 없습니다")
+                return True
+
+            total_size = sum(f[2] for f in archive_files) + sum(f[2] for f in large_files)
+            print(f"업로드할 파일 수: {total_files} (tar 묶음 {len(archive_files)}개, 개별 업로드 {len(large_files)}개)")
+            print(f"총 크기: {self.format_file_size(total_size)}")
+
+            progress = TransferProgress(total_size, progress_callback, report_interval=5)
+            failed_files = []
+
+            batch = []
+            batch_bytes = 0
+            for entry in archive_files:
+                batch.append(entry)
+                batch_bytes += entry[2]
+                if len(batch) >= self.extract_archive_batch_files or batch_bytes >= self.extract_archive_batch_bytes:
+                    failed_files.extend(self._upload_tar_batch(container_name, remote_base_path, batch, progress))
+                    batch = []
+                    batch_bytes = 0
+            if batch:
+                failed_files.extend(self._upload_tar_batch(container_name, remote_base_path, batch, progress))
+
+            for file_path, relative_path, file_size in large_files:
+                remote_object_name = f"{remote_base_path}/{relative_path}"
+                if self.upload_file(container_name, remote_object_name, file_path):
+                    progress.add(file_size)
+                else:
+                    failed_files.append(relative_path)
+
+            if progress_callback:
+                progress_callback(100)
+
+            uploaded_files = total_files - len(failed_files)
+            print(f"폴더 업로드 완료: {uploaded_files}/{total_files} 파일 성공")
+
+            if failed_files:
+                print(f"실패한 파일들:")
+                for failed_file in failed_files:
+                    print(f"  - {failed_file}")
+                return False
+
+            return True
+
+        except Exception as e:
+            print(f"폴더 업로드 오류: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return False
+
+    def _upload_tar_batch(self, container_name, remote_base_path, batch, progress):
+
+        url = f"{self.storage_url}/v1/AUTH_{self.project_id}/{container_name}"
+        if remote_base_path.strip('/'):
+            url += f"/{remote_base_path.strip('/')}"
+
+        print(f"tar 묶음 업로드: {len(batch)}개 파일, {self.format_file_size(sum(f[2] for f in batch))}")
+
+        try:
+            response = self._make_request(
+                'PUT',
+                f"{url}?extract-archive=tar",
+                data=self._iter_tar_stream(batch, progress),
+                headers={
+                    'Content-Type': 'application/x-tar',
+                    'Accept': 'application/json'
+                },
+                timeout=3600
+            )
+
+            if response.status_code not in [200, 201]:
+                raise Exception(f"상태 코드 {response.status_code} - {response.text}")
+
+            report = response.json()
+            response_status = report.get('Response Status', '201 Created')
+            errors = report.get('Errors', [])
+            print(f"tar 묶음 결과: {report.get('Number Files Created', 0)}개 생성, 오류 {len(errors)}개 ({response_status})")
+
+            if not response_status.startswith('2') and not errors:
+                raise Exception(f"{response_status} {report.get('Response Body', '')}")
+
+            failed_files = []
+            for path, status in errors:
+                name = unquote(path).lstrip('/').split('/', 1)[-1]
+                base = remote_base_path.strip('/')
+                if base and name.startswith(f"{base}/"):
+                    name = name[len(base) + 1:]
+                failed_files.append(f"{name} ({status})")
+            return failed_files
+
+        except Exception as e:
+            print(f"tar 묶음 업로드 오류: {str(e)}")
+            return [relative_path for file_path, relative_path, file_size in batch]
+
+    def _iter_tar_stream(self, batch, progress):
+
+        for file_path, relative_path, file_size in batch:
+            info = tarfile.TarInfo(relative_path)
+            info.size = file_size
+            info.mtime = int(os.path.getmtime(file_path))
+            info.mode = 0o644
+            yield info.tobuf(format=tarfile.PAX_FORMAT, encoding='utf-8')
+
+            remaining = file_size
+            with open(file_path, 'rb') as f:
+                while remaining > 0:
+                    block = f.read(min(remaining, 1024 * 1024))
+                    if not block:
+                        raise Exception(f"파일 크기가 변경됨: {relative_path}")
+                    remaining -= len(block)
+                    progress.add(len(block))
+                    yield block
+
+            padding = -file_size % tarfile.BLOCKSIZE
+            if padding:
+                yield b'\0' * padding
+
+        yield b'\0' * (tarfile.BLOCKSIZE * 2)
+
     @staticmethod
     def format_file_size(size_bytes):
 
@@ -677,24 +1877,35 @@ class NaverArchiveStorageClient:
         s = round(size_bytes / p, 1)
         return f"{s} {size_names[i]}"
 
+    def iter_objects(self, container_name, prefix="", delimiter="/", page_size=1000):
+
+        # 정렬(폴더 우선)은 페이지 단위로만 적용되며, 중복 제거는 전체 페이지에 걸쳐 유지
+        seen_items = set()
+        for page in self._iter_listing_pages(container_name, prefix, delimiter, page_size):
+            yield self._list_entries(self.parse_folder_structure(page, prefix, seen_items))
+
     def list_objects(self, container_name, prefix="", delimiter="/"):
 
         try:
-            objects = self.get_objects_with_prefix(container_name, prefix)
-            parsed_objects = self.parse_folder_structure(objects, prefix)
-
             result = []
-            for obj in parsed_objects:
-                result.append({
-                    'name': obj['name'],
-                    'size': obj.get('bytes', 0),
-                    'type': obj['type'],
-                    'last_modified': obj.get('last_modified', ''),
-                    'key': obj.get('full_path', obj['name'])
-                })
+            for page in self.iter_objects(container_name, prefix, delimiter):
+                result.extend(page)
 
-            return result
+            return sorted(result, key=lambda item: (item['type'] != 'folder', item['name'].lower()))
 
         except Exception as e:
             print(f"객체 목록 조회 오류: {str(e)}")
-            return []
\ No newline at end of file
+            return []
+
+    def _list_entries(self, parsed_objects):
+
+        return [
+            {
+                'name': obj['name'],
+                'size': obj.get('bytes', 0),
+                'type': obj['type'],
+                'last_modified': obj.get('last_modified', ''),
+                'key': obj.get('full_path', obj['name'])
+            }
+            for obj in parsed_objects
+        ]
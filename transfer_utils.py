@@ -0,0 +1,422 @@
+import asyncio
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+
+class TransferProgress:
+
+    def __init__(self, total_bytes, progress_callback=None, report_interval=None):
+        self.total_bytes = total_bytes
+        self.progress_callback = progress_callback
+        self.report_interval = report_interval
+        self.transferred_bytes = 0
+        self.start_time = time.monotonic()
+        self._last_progress = -1
+        self._last_report = self.start_time
+        self._lock = threading.Lock()
+
+    def add(self, nbytes):
+
+        with self._lock:
+            self.transferred_bytes += nbytes
+
+            if self.report_interval and time.monotonic() - self._last_report >= self.report_interval:
+                self._last_report = time.monotonic()
+                print(self.status_text())
+
+            if not self.progress_callback or self.total_bytes <= 0:
+                return
+
+            progress = min(int((self.transferred_bytes / self.total_bytes) * 100), 100)
+            if progress != self._last_progress:
+                self._last_progress = progress
+                self.progress_callback(progress)
+
+    def file_callback(self, file_size):
+        return FileProgressCallback(self, file_size)
+
+    def throughput(self):
+
+        elapsed = time.monotonic() - self.start_time
+        return self.transferred_bytes / elapsed if elapsed > 0 else 0.0
+
+    def eta(self):
+
+        rate = self.throughput()
+        if rate <= 0:
+            return None
+        return max(self.total_bytes - self.transferred_bytes, 0) / rate
+
+    def status_text(self):
+
+        percent = (self.transferred_bytes / self.total_bytes * 100) if self.total_bytes > 0 else 100.0
+        eta = self.eta()
+        eta_text = time.strftime('%H:%M:%S', time.gmtime(eta)) if eta is not None else '--:--:--'
+        return (f"진행률 {percent:.1f}% ({format_size(self.transferred_bytes)}/{format_size(self.total_bytes)}), "
+                f"{format_size(self.throughput())}/s, 남은 시간 {eta_text}")
+
+
+class FileProgressCallback:
+
+    def __init__(self, progress, file_size):
+        self.progress = progress
+        self.file_size = file_size
+        self.reported_bytes = 0
+
+    def __call__(self, file_progress):
+
+        # 파일 단위 진행률(%)을 전체 진행률의 바이트 수로 환산
+        file_bytes = self.file_size * min(file_progress, 100) // 100
+        self.progress.add(file_bytes - self.reported_bytes)
+        self.reported_bytes = file_bytes
+
+    def finish(self):
+
+        self.progress.add(self.file_size - self.reported_bytes)
+        self.reported_bytes = self.file_size
+
+
+def run_file_transfers(progress, file_sizes, transfer, workers):
+
+    results = [False] * len(file_sizes)
+    slots = threading.Semaphore(workers * 2)
+
+    def run(index):
+        file_callback = progress.file_callback(file_sizes[index])
+        try:
+            results[index] = bool(transfer(index, file_callback))
+        except Exception as e:
+            print(f"파일 전송 오류: {str(e)}")
+        finally:
+            file_callback.finish()
+            slots.release()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for index in range(len(file_sizes)):
+            slots.acquire()
+            executor.submit(run, index)
+
+    return results
+
+
+def format_size(size_bytes):
+
+    size_names = ["B", "KB", "MB", "GB", "TB"]
+    i = 0
+    while size_bytes >= 1024.0 and i < len(size_names) - 1:
+        size_bytes /= 1024.0
+        i += 1
+
+    return f"{size_bytes:.1f} {size_names[i]}"
+
+
+class FilePartReader:
+
+    def __init__(self, file_path, offset, length, budget=None):
+        self.offset = offset
+        self.length = length
+        self.budget = budget
+        self._position = 0
+        self._held_bytes = 0
+        self._file = open(file_path, 'rb')
+        self._file.seek(offset)
+
+    def __len__(self):
+        return self.length
+
+    def read(self, size=-1):
+
+        remaining = self.length - self._position
+        if remaining <= 0:
+            return b''
+
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+
+        self._hold(size)
+        data = self._file.read(size)
+        self._position += len(data)
+        return data
+
+    def seek(self, position, whence=0):
+
+        if whence == 1:
+            position += self._position
+        elif whence == 2:
+            position += self.length
+
+        self._position = max(0, min(position, self.length))
+        self._file.seek(self.offset + self._position)
+        return self._position
+
+    def tell(self):
+        return self._position
+
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def _hold(self, nbytes):
+
+        # 파트 전체가 아니라 실제로 메모리에 올라가는 읽기 블록만큼만 예산을 사용
+        if self.budget is None:
+            return
+        if self._held_bytes:
+            self.budget.release(self._held_bytes)
+            self._held_bytes = 0
+        if nbytes:
+            self._held_bytes = self.budget.acquire(nbytes)
+
+    def close(self):
+        self._hold(0)
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class InFlightBudget:
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.in_flight_bytes = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, nbytes):
+
+        nbytes = min(nbytes, self.max_bytes)
+        with self._condition:
+            while self.in_flight_bytes > 0 and self.in_flight_bytes + nbytes > self.max_bytes:
+                self._condition.wait()
+            self.in_flight_bytes += nbytes
+        return nbytes
+
+    def release(self, nbytes):
+
+        with self._condition:
+            self.in_flight_bytes -= nbytes
+            self._condition.notify_all()
+
+
+class TransferJournal:
+
+    def __init__(self, journal_dir, kind, identity):
+        self.identity = identity
+        digest = hashlib.sha256(json.dumps(identity, sort_keys=True).encode('utf-8')).hexdigest()[:32]
+        self.path = os.path.join(journal_dir, f"{kind}_{digest}.jsonl")
+        self._lock = threading.Lock()
+
+    def load(self):
+
+        entries = {}
+        if not os.path.exists(self.path):
+            return entries
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline() or 'null')
+                if not header or header.get('identity') != self.identity:
+                    return {}
+
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    entries[record['key']] = record['entry']
+
+        except Exception as e:
+            print(f"전송 기록 읽기 오류: {str(e)}")
+            return {}
+
+        return entries
+
+    def start(self, entries=None):
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'identity': self.identity}, ensure_ascii=False) + '\n')
+                for key, entry in (entries or {}).items():
+                    f.write(json.dumps({'key': key, 'entry': entry}, ensure_ascii=False) + '\n')
+
+    def record(self, key, entry):
+
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'key': key, 'entry': entry}, ensure_ascii=False) + '\n')
+
+    def remove(self):
+
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+class TransferStatusError(Exception):
+
+    def __init__(self, message, status_code=None, headers=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class RetryPolicy:
+
+    def __init__(self, max_attempts=5, base_delay=1.0, max_delay=30.0, time_budget=900,
+                 retry_statuses=(429, 500, 502, 503, 504), network_errors=(ConnectionError, TimeoutError),
+                 timeout_attempts=3):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.time_budget = time_budget
+        self.timeout_attempts = timeout_attempts
+        self.retry_statuses = set(retry_statuses)
+        self.network_errors = network_errors
+        self.stats = {'calls': 0, 'attempts': 0, 'retries': 0, 'retry_after_waits': 0, 'exhausted': 0}
+        self._lock = threading.Lock()
+
+    def backoff(self, attempt):
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def retry_after(self, status_code, headers):
+
+        if status_code not in (429, 503) or not headers:
+            return None
+
+        value = headers.get('Retry-After') or headers.get('retry-after')
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def budget_for_timeout(self, timeout):
+
+        # 요청 타임아웃이 긴 경우에도 전체 시간 동안 timeout_attempts회는 시도할 수 있도록 예산을 늘림
+        if not self.time_budget or not isinstance(timeout, (int, float)):
+            return self.time_budget
+        return max(self.time_budget, timeout * self.timeout_attempts)
+
+    def is_retryable_error(self, error):
+
+        if getattr(error, 'status_code', None) in self.retry_statuses:
+            return True
+        return isinstance(error, self.network_errors)
+
+    def call(self, operation, description='요청', is_retryable_error=None, time_budget=None):
+
+        is_retryable_error = is_retryable_error or self.is_retryable_error
+        time_budget = time_budget or self.time_budget
+        deadline = time.monotonic() + time_budget if time_budget else None
+        self._count('calls')
+
+        attempt = 0
+        while True:
+            self._count('attempts')
+            error = None
+            try:
+                result = operation()
+            except Exception as e:
+                if not is_retryable_error(e):
+                    raise
+                error = e
+                status_code = getattr(e, 'status_code', None)
+                headers = getattr(e, 'headers', None)
+                reason = str(e)
+            else:
+                status_code = getattr(result, 'status_code', None)
+                if status_code not in self.retry_statuses:
+                    return result
+                headers = getattr(result, 'headers', None)
+                reason = f"상태 코드 {status_code}"
+
+            attempt += 1
+            delay = self._next_delay(attempt, status_code, headers, deadline, description, reason)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return result
+
+            if error is None and hasattr(result, 'close'):
+                result.close()
+            time.sleep(delay)
+
+    async def call_async(self, operation, description='요청', is_retryable_error=None, time_budget=None):
+
+        is_retryable_error = is_retryable_error or self.is_retryable_error
+        time_budget = time_budget or self.time_budget
+        deadline = time.monotonic() + time_budget if time_budget else None
+        self._count('calls')
+
+        attempt = 0
+        while True:
+            self._count('attempts')
+            error = None
+            try:
+                result = await operation()
+            except Exception as e:
+                if not is_retryable_error(e):
+                    raise
+                error = e
+                status_code = getattr(e, 'status_code', None)
+                headers = getattr(e, 'headers', None)
+                reason = str(e) or type(e).__name__
+            else:
+                status_code = getattr(result, 'status_code', None)
+                if status_code not in self.retry_statuses:
+                    return result
+                headers = getattr(result, 'headers', None)
+                reason = f"상태 코드 {status_code}"
+
+            attempt += 1
+            delay = self._next_delay(attempt, status_code, headers, deadline, description, reason)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return result
+
+            await asyncio.sleep(delay)
+
+    def _next_delay(self, attempt, status_code, headers, deadline, description, reason):
+
+        delay = self.retry_after(status_code, headers)
+        if delay is not None:
+            self._count('retry_after_waits')
+        else:
+            delay = self.backoff(attempt - 1)
+
+        out_of_time = deadline is not None and time.monotonic() + delay > deadline
+        if attempt >= self.max_attempts or out_of_time:
+            self._count('exhausted')
+            print(f"{description} 재시도 중단 ({attempt}회 시도): {reason}")
+            return None
+
+        self._count('retries')
+        print(f"{description} 재시도 {attempt}/{self.max_attempts - 1}: {reason}, {delay:.1f}초 후")
+        return delay
+
+    def _count(self, key):
+
+        with self._lock:
+            self.stats[key] += 1